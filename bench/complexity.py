@@ -0,0 +1,159 @@
+"""Check how each solve_for's time grows against its expected complexity
+
+    $ python -m bench.complexity
+    $ python -m bench.complexity day03 day11 --tolerance 0.25
+
+Every solver is timed on generated inputs of doubling size, and the exponent
+k of time ~ size**k is fitted by least squares on a log-log scale. A solver
+fails when k exceeds the exponent declared for it in EXPECTED by more than
+--tolerance, e.g. a near-linear solver that has become quadratic, and when it
+raises on any size. Sizes are in each generator's own unit, so a day 3
+schematic of size n has n**2 cells.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from typing import NamedTuple
+
+from bench.generators import GENERATORS
+from support import memoize, solvers
+
+
+class Complexity(NamedTuple):
+    exponent: float
+    description: str
+
+
+# Exponents are of each generator's size, e.g. day 3's schematics have
+# O(n**2) numbers and symbols, so checking every number against every symbol
+# is O(n**4). n log n is declared as linear: it can't be told apart here.
+EXPECTED: dict[str, Complexity] = {
+    "day01.part1": Complexity(1, "O(lines)"),
+    "day01.part2": Complexity(1, "O(lines)"),
+    "day02.part1": Complexity(1, "O(games)"),
+    "day02.part2": Complexity(1, "O(games)"),
+    "day03.part1": Complexity(4, "O(N·S)"),
+    "day03.part2": Complexity(6, "O(G·N·S)"),
+    "day04.part1": Complexity(1, "O(cards)"),
+    "day04.part2": Complexity(1, "O(cards)"),
+    "day05.part1": Complexity(1, "O(E log E)"),
+    "day05.part2": Complexity(1, "O(E log E)"),
+    "day06.part1": Complexity(1, "O(races)"),
+    "day06.part2": Complexity(1, "O(digits)"),
+    "day07.part1": Complexity(1, "O(H log H)"),
+    "day07.part2": Complexity(1, "O(H log H)"),
+    "day08.part1": Complexity(1, "O(nodes)"),
+    "day08.part2": Complexity(1, "O(nodes)"),
+    "day09.part1": Complexity(1, "O(histories)"),
+    "day09.part2": Complexity(1, "O(histories)"),
+    "day10.part1": Complexity(2, "O(cells)"),
+    "day10.part2": Complexity(2, "O(cells)"),
+    # Generated images are dense enough that empty rows and columns are rare
+    "day11.part1": Complexity(2, "O(G²·E)"),
+    "day11.part2": Complexity(2, "O(G²·E)"),
+    "day15.part1": Complexity(1, "O(steps)"),
+    "day15.part2": Complexity(1, "O(steps)"),
+}
+
+# Solves faster than this are mostly fixed overhead, so they aren't fitted
+MIN_SECONDS = 0.002
+
+
+def best_time(module_name: str, input_data: str, repeat: int) -> float:
+    solver = solvers.load(module_name)
+    best = float("inf")
+    for _ in range(repeat):
+        # Module-level memos would otherwise stay warm from the previous run
+        memoize.clear()
+        start = time.perf_counter()
+        solver(input_data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def fit_exponent(points: list[tuple[int, float]]) -> float:
+    """Least squares slope of log(seconds) over log(size)"""
+
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(seconds) for _, seconds in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("days", nargs="*", help="e.g. day05 (default: all)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="how far the fitted exponent may exceed the expected (default: 0.5)",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=2.0,
+        help="stop growing a solver's input once one solve takes this many seconds",
+    )
+    args = parser.parse_args()
+
+    failures = 0
+    for module_name in solvers.discover(args.days):
+        day, _, _ = module_name.partition(".")
+        if day not in GENERATORS:
+            continue
+        generator = GENERATORS[day]
+
+        points = []
+        errored = False
+        for size in generator.sizes:
+            input_data = generator.generate(size, args.seed)
+            try:
+                seconds = best_time(module_name, input_data, args.repeat)
+            except Exception as e:
+                print(f"{module_name:<12} {size:>8} {generator.unit:<16} ERROR: {e!r}")
+                failures += 1
+                errored = True
+                break
+            if seconds >= MIN_SECONDS:
+                points.append((size, seconds))
+            if seconds > args.budget:
+                break
+
+        if errored:
+            continue
+        expected = EXPECTED.get(module_name)
+        declared = f"{expected.description:<14}" if expected else f"{'?':<14}"
+        if len(points) < 2:
+            print(f"{module_name:<12} {declared} too few timed sizes to fit")
+            continue
+
+        exponent = fit_exponent(points)
+        if expected is None:
+            status = "no expected complexity"
+        elif exponent > expected.exponent + args.tolerance:
+            failures += 1
+            status = f"FAIL, expected k <= {expected.exponent + args.tolerance:.2f}"
+        else:
+            status = "ok"
+        print(
+            f"{module_name:<12} {declared} k={exponent:5.2f} "
+            f"over {points[0][0]}..{points[-1][0]} {generator.unit:<16} {status}"
+        )
+
+    if failures:
+        print(f"{failures} solver(s) raised or grew faster than expected")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
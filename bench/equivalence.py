@@ -0,0 +1,280 @@
+"""Check the faster ways of running solvers against their plain solve_for
+
+    $ python -m bench.equivalence
+    $ python -m bench.equivalence day02 day09 --cases 50 --seed 1234
+
+Each solver's `solve_for` is the reference. Every other engine that applies to
+the solver module is run side by side with it on randomly generated inputs:
+
+- solve_lines: streaming records decoded from a buffer, as support.cli does
+- combine: the buffer split into chunks of records, each solved on its own
+  and merged with the module's `combine`, as --workers does
+- parse_cache: parsers wrapped in support.cached_parse loading their result
+  from the on-disk cache rather than parsing
+- shard: the buffer cut into shards, whose partial aggregates go through JSON
+  and are merged, as --shard and --merge do
+
+Any disagreement is reported with the input minimized to as few records as
+still disagree. A comparison that raises, e.g. because solve_for fails on a
+generated input, fails the run too. The speedup is the reference's total time over the engine's,
+taking the best of --repeat runs per input.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os.path
+import random
+import re
+import sys
+import tempfile
+import time
+from types import ModuleType
+from typing import Callable, NamedTuple
+
+import support
+from bench.generators import GENERATORS
+from support import cache, mapreduce, shard, solvers
+
+Engine = Callable[[str], object]
+
+
+def line_engine(module: ModuleType) -> Engine | None:
+    line_solver = getattr(module, "solve_lines", None)
+    if not line_solver:
+        return None
+    separator = getattr(module, "RECORD_SEPARATOR", "\n")
+
+    def solve(input_data: str) -> object:
+        return line_solver(support.iter_records(input_data.encode(), separator))
+
+    return solve
+
+
+def combine_engine(module: ModuleType) -> Engine | None:
+    line_solver = getattr(module, "solve_lines", None)
+    combine = getattr(module, "combine", None)
+    if not (line_solver and combine):
+        return None
+    separator = getattr(module, "RECORD_SEPARATOR", "\n")
+
+    def solve(input_data: str) -> object:
+        buffer = input_data.encode()
+        # Split differently each time, to catch answers that depend on it
+        chunks = random.randint(2, 8)
+        return combine(
+            line_solver(support.iter_records(buffer, separator, start, end))
+            for start, end in mapreduce.split_records(buffer, separator, chunks)
+        )
+
+    return solve
+
+
+def parse_cache_engine(module: ModuleType) -> Engine | None:
+    package, _, _ = module.__name__.rpartition(".")
+    package_modules = [
+        m for name, m in sys.modules.items() if name.startswith(f"{package}.")
+    ]
+    # Every parser wrapped by support.cached_parse shares the wrapper's code
+    cached_parser_code = support.cached_parse(str).__code__
+    if not any(
+        getattr(obj, "__code__", None) is cached_parser_code
+        for package_module in package_modules
+        for obj in vars(package_module).values()
+    ):
+        return None
+
+    def solve(input_data: str) -> object:
+        support.disk_cache_enabled = True
+        try:
+            return module.solve_for(input_data)
+        finally:
+            support.disk_cache_enabled = False
+
+    return solve
+
+
+def shard_engine(module: ModuleType) -> Engine | None:
+    if not (hasattr(module, "solve_partial") or hasattr(module, "combine")):
+        return None
+    partial_solver = shard.partial_solver(module)
+    merge = shard.merger(module)
+    separator = getattr(module, "RECORD_SEPARATOR", "\n")
+
+    def solve(input_data: str) -> object:
+        buffer = input_data.encode()
+        shards = random.randint(1, 8)
+        partials = []
+        for index in range(1, shards + 1):
+            start, end = shard.shard_range(buffer, separator, index, shards)
+            partial = partial_solver(
+                support.iter_records(buffer, separator, start, end)
+            )
+            partials.append(json.loads(json.dumps(partial)))
+        return merge(partials)
+
+    return solve
+
+
+ENGINES: dict[str, Callable[[ModuleType], Engine | None]] = {
+    "solve_lines": line_engine,
+    "combine": combine_engine,
+    "parse_cache": parse_cache_engine,
+    "shard": shard_engine,
+}
+
+
+class Comparison(NamedTuple):
+    cases: int
+    mismatch: tuple[str, str, str] | None
+    reference_time: float
+    engine_time: float
+
+
+def outcome(solve: Engine, input_data: str) -> str:
+    try:
+        return repr(solve(input_data))
+    except Exception as e:
+        return f"raised {e!r}"
+
+
+def best_time(solve: Engine, input_data: str, repeat: int) -> tuple[str, float]:
+    # The first run is a warm-up, e.g. filling the parse cache
+    answer = outcome(solve, input_data)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        answer = outcome(solve, input_data)
+        best = min(best, time.perf_counter() - start)
+    return answer, best
+
+
+def split_records(input_data: str, separator: str) -> list[str]:
+    """Split into records that still end with their separator"""
+
+    return [r for r in re.split(f"(?<={re.escape(separator)})", input_data) if r]
+
+
+def minimize(input_data: str, separator: str, disagree: Callable[[str], bool]) -> str:
+    """Drop as many records as possible while the engines still disagree"""
+
+    records = split_records(input_data, separator)
+    chunk = len(records) // 2
+    while chunk >= 1:
+        start = 0
+        while start < len(records):
+            candidate = records[:start] + records[start + chunk :]
+            if candidate and disagree("".join(candidate)):
+                records = candidate
+            else:
+                start += chunk
+        chunk //= 2
+    return "".join(records)
+
+
+def compare(
+    module: ModuleType, engine: Engine, inputs: list[str], repeat: int
+) -> Comparison:
+    reference: Engine = module.solve_for
+    separator = getattr(module, "RECORD_SEPARATOR", "\n")
+
+    def disagree(input_data: str) -> bool:
+        expected = outcome(reference, input_data)
+        return not expected.startswith("raised") and (
+            outcome(engine, input_data) != expected
+        )
+
+    reference_time = engine_time = 0.0
+    for case, input_data in enumerate(inputs, 1):
+        expected, reference_best = best_time(reference, input_data, repeat)
+        if expected.startswith("raised"):
+            raise ValueError(f"solve_for {expected} on case {case}")
+        actual, engine_best = best_time(engine, input_data, repeat)
+        reference_time += reference_best
+        engine_time += engine_best
+        if actual != expected:
+            minimized = minimize(input_data, separator, disagree)
+            return Comparison(
+                case,
+                (
+                    minimized,
+                    outcome(reference, minimized),
+                    outcome(engine, minimized),
+                ),
+                reference_time,
+                engine_time,
+            )
+
+    return Comparison(len(inputs), None, reference_time, engine_time)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("days", nargs="*", help="e.g. day05 (default: all)")
+    parser.add_argument("--cases", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--seed", type=int, help="seed for the generated inputs (default: random)"
+    )
+    args = parser.parse_args()
+
+    seed = random.randrange(2**32) if args.seed is None else args.seed
+    print(f"seed {seed}")
+    random.seed(seed)
+
+    mismatches = 0
+    # Comparisons that raised, so had no outcome to check
+    errors = 0
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Don't read or pollute the real parse and memo caches
+        cache.parsed.directory = os.path.join(cache_dir, "parsed")
+        cache.memos.directory = os.path.join(cache_dir, "memos")
+
+        for module_name in solvers.discover(args.days):
+            day, _, _ = module_name.partition(".")
+            if day not in GENERATORS:
+                continue
+            module = solvers.load_module(module_name)
+            generator = GENERATORS[day]
+            inputs = [
+                generator.generate(generator.sizes[0], random.randrange(2**32))
+                for _ in range(args.cases)
+            ]
+
+            for engine_name, make_engine in ENGINES.items():
+                engine = make_engine(module)
+                if engine is None:
+                    continue
+                try:
+                    result = compare(module, engine, inputs, args.repeat)
+                except Exception as e:
+                    errors += 1
+                    print(f"{module_name:<12} {engine_name:<12} ERROR: {e!r}")
+                    continue
+                speedup = result.reference_time / result.engine_time
+                if result.mismatch is None:
+                    status = f"{result.cases} cases agree"
+                else:
+                    mismatches += 1
+                    status = f"MISMATCH on case {result.cases}"
+                print(
+                    f"{module_name:<12} {engine_name:<12} {status:<20} "
+                    f"{speedup:6.2f}x"
+                )
+                if result.mismatch is not None:
+                    minimized, expected, actual = result.mismatch
+                    print(f"  solve_for:    {expected}")
+                    print(f"  {engine_name + ':':<13} {actual}")
+                    print("  minimized input:")
+                    for line in minimized.splitlines():
+                        print(f"    {line}")
+
+    if mismatches or errors:
+        print(f"{mismatches} mismatch(es), {errors} error(s), rerun with --seed {seed}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,280 @@
+"""Seeded synthetic input generators, one per implemented day
+
+Every generator takes a `size` (what "size" means is day specific, see
+`GENERATORS`) and a `seed`, and returns the text of a valid puzzle input.
+The same size and seed always produce the same input.
+"""
+
+from __future__ import annotations
+
+import random
+import string
+from typing import Callable, NamedTuple
+
+Generator = Callable[[int, int], str]
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+COLOURS = ["red", "green", "blue"]
+SCHEMATIC_SYMBOLS = "*#+$/=%@&-"
+CAMEL_CARDS = "23456789TJQKA"
+ALMANAC_CATEGORIES = [
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+]
+PIPES = "|-LJ7F"
+
+
+def generate_day01(size: int, seed: int = 0) -> str:
+    """`size` calibration lines"""
+
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        parts = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 6)):
+            kind = rng.random()
+            if kind < 0.5:
+                parts.append("".join(rng.choices(string.ascii_lowercase, k=3)))
+            elif kind < 0.8:
+                parts.append(rng.choice(DIGIT_WORDS))
+            else:
+                parts.append(str(rng.randint(1, 9)))
+        rng.shuffle(parts)
+        lines.append("".join(parts))
+    return "\n".join(lines) + "\n"
+
+
+def generate_day02(size: int, seed: int = 0) -> str:
+    """`size` game records"""
+
+    rng = random.Random(seed)
+    lines = []
+    for game_id in range(1, size + 1):
+        rounds = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(COLOURS, rng.randint(1, 3))
+            rounds.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colours))
+        lines.append(f"Game {game_id}: {'; '.join(rounds)}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day03(size: int, seed: int = 0) -> str:
+    """A `size` x `size` engine schematic"""
+
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(size):
+        row: list[str] = []
+        while len(row) < size:
+            kind = rng.random()
+            if kind < 0.15:
+                row.extend(str(rng.randint(1, 999)))
+                row.append(".")
+            elif kind < 0.22:
+                row.append(rng.choice(SCHEMATIC_SYMBOLS))
+            else:
+                row.append(".")
+        rows.append("".join(row[:size]))
+    return "\n".join(rows) + "\n"
+
+
+def generate_day04(size: int, seed: int = 0) -> str:
+    """`size` scratchcards"""
+
+    rng = random.Random(seed)
+    lines = []
+    for card_id in range(1, size + 1):
+        winning_numbers = rng.sample(range(1, 100), 5)
+        numbers = rng.sample(range(1, 100), 8)
+        lines.append(
+            f"Card {card_id:>3}: "
+            f"{' '.join(f'{n:>2}' for n in winning_numbers)} | "
+            f"{' '.join(f'{n:>2}' for n in numbers)}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def generate_day05(size: int, seed: int = 0) -> str:
+    """An almanac with `size` entries in every map"""
+
+    rng = random.Random(seed)
+    space = size * 1_000
+    seeds = []
+    for _ in range(10):
+        start = rng.randrange(space)
+        seeds.extend([start, rng.randint(1, 100)])
+
+    sections = [f"seeds: {' '.join(str(s) for s in seeds)}"]
+    for src, dest in zip(ALMANAC_CATEGORIES, ALMANAC_CATEGORIES[1:]):
+        # Disjoint source ranges: pair up sorted, distinct cut points
+        cuts = sorted(rng.sample(range(space), 2 * size))
+        entries = [
+            f"{rng.randrange(space)} {start} {stop - start}"
+            for start, stop in zip(cuts[::2], cuts[1::2])
+        ]
+        rng.shuffle(entries)
+        sections.append("\n".join([f"{src}-to-{dest} map:", *entries]))
+    return "\n\n".join(sections) + "\n"
+
+
+def generate_day06(size: int, seed: int = 0) -> str:
+    """`size` races"""
+
+    rng = random.Random(seed)
+    durations = [rng.randint(10, 99) for _ in range(size)]
+    distances = [rng.randint(1, (d // 2) * (d - d // 2) - 1) for d in durations]
+    return (
+        f"Time:     {' '.join(f'{d:>4}' for d in durations)}\n"
+        f"Distance: {' '.join(f'{d:>4}' for d in distances)}\n"
+    )
+
+
+def generate_day07(size: int, seed: int = 0) -> str:
+    """`size` hands of camel cards"""
+
+    rng = random.Random(seed)
+    lines = [
+        f"{''.join(rng.choices(CAMEL_CARDS, k=5))} {rng.randint(1, 1000)}"
+        for _ in range(size)
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def generate_day08(size: int, seed: int = 0) -> str:
+    """A network of `size` nodes, with `size - 1` steps from AAA to ZZZ
+
+    Only AAA ends in "A" and only ZZZ ends in "Z", so the input is valid for
+    both parts.
+    """
+
+    rng = random.Random(seed)
+    labels = [
+        a + b + c
+        for a in string.ascii_uppercase
+        for b in string.ascii_uppercase
+        for c in string.ascii_uppercase
+        if c not in "AZ"
+    ]
+    if size - 2 > len(labels):
+        raise ValueError(f"At most {len(labels) + 2} nodes are supported")
+    path = ["AAA", *rng.sample(labels, max(size - 2, 0)), "ZZZ"]
+
+    instructions = "".join(rng.choices("LR", k=rng.randint(2, 300)))
+    nodes = []
+    for step, label in enumerate(path[:-1]):
+        # The walk visits the path in order, so the side taken at each step
+        # leads on and the other side can go anywhere
+        onward = path[step + 1]
+        elsewhere = rng.choice(path)
+        if instructions[step % len(instructions)] == "L":
+            nodes.append(f"{label} = ({onward}, {elsewhere})")
+        else:
+            nodes.append(f"{label} = ({elsewhere}, {onward})")
+    nodes.append("ZZZ = (ZZZ, ZZZ)")
+    rng.shuffle(nodes)
+
+    return f"{instructions}\n\n" + "\n".join(nodes) + "\n"
+
+
+def generate_day09(size: int, seed: int = 0) -> str:
+    """`size` histories of 21 values, each from a polynomial of degree <= 5"""
+
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 6))]
+        values = [
+            sum(c * x**power for power, c in enumerate(coefficients))
+            for x in range(21)
+        ]
+        lines.append(" ".join(str(v) for v in values))
+    return "\n".join(lines) + "\n"
+
+
+def generate_day10(size: int, seed: int = 0) -> str:
+    """A `size` x `size` field of pipes with one rectangular loop through S"""
+
+    rng = random.Random(seed)
+    size = max(size, 5)
+    grid = [["."] * size for _ in range(size)]
+    for y in range(2, size - 2):
+        for x in range(2, size - 2):
+            grid[y][x] = rng.choice(PIPES + ".")
+
+    top, left, bottom, right = 1, 1, size - 2, size - 2
+    for x in range(left + 1, right):
+        grid[top][x] = grid[bottom][x] = "-"
+    for y in range(top + 1, bottom):
+        grid[y][left] = grid[y][right] = "|"
+    grid[top][left] = "F"
+    grid[top][right] = "7"
+    grid[bottom][left] = "L"
+    grid[bottom][right] = "J"
+
+    corners = [(left, top), (right, top), (left, bottom), (right, bottom)]
+    start_x, start_y = rng.choice(corners)
+    grid[start_y][start_x] = "S"
+
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def generate_day11(size: int, seed: int = 0) -> str:
+    """An image containing `size` galaxies"""
+
+    rng = random.Random(seed)
+    side = max(10, int(size**0.5 * 3))
+    galaxies = rng.sample(range(side * side), size)
+    image = [["."] * side for _ in range(side)]
+    for galaxy in galaxies:
+        image[galaxy // side][galaxy % side] = "#"
+    return "\n".join("".join(row) for row in image) + "\n"
+
+
+def generate_day15(size: int, seed: int = 0) -> str:
+    """An initialization sequence of `size` steps"""
+
+    rng = random.Random(seed)
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(max(size // 4, 1))
+    ]
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        if rng.random() < 0.7:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+        else:
+            steps.append(f"{label}-")
+    return ",".join(steps) + "\n"
+
+
+class DayGenerator(NamedTuple):
+    generate: Generator
+    sizes: tuple[int, ...]
+    unit: str
+
+
+def _doubling(start: int, count: int) -> tuple[int, ...]:
+    return tuple(start * 2**i for i in range(count))
+
+
+GENERATORS: dict[str, DayGenerator] = {
+    "day01": DayGenerator(generate_day01, _doubling(1_000, 8), "lines"),
+    "day02": DayGenerator(generate_day02, _doubling(1_000, 8), "games"),
+    "day03": DayGenerator(generate_day03, _doubling(20, 5), "rows and cols"),
+    "day04": DayGenerator(generate_day04, _doubling(1_000, 8), "cards"),
+    "day05": DayGenerator(generate_day05, _doubling(100, 7), "entries per map"),
+    "day06": DayGenerator(generate_day06, (1, 2, 4, 8), "races"),
+    "day07": DayGenerator(generate_day07, _doubling(1_000, 7), "hands"),
+    "day08": DayGenerator(generate_day08, _doubling(250, 7), "nodes"),
+    "day09": DayGenerator(generate_day09, _doubling(1_000, 7), "histories"),
+    "day10": DayGenerator(generate_day10, _doubling(25, 6), "rows and cols"),
+    "day11": DayGenerator(generate_day11, _doubling(25, 6), "galaxies"),
+    "day15": DayGenerator(generate_day15, _doubling(1_000, 8), "steps"),
+}
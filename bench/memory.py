@@ -0,0 +1,136 @@
+"""Measure the bytes per parsed record of the slots-based domain models
+
+    $ python -m bench.memory
+    $ python -m bench.memory day03 day05
+
+Each day's parser is run over a generated input under tracemalloc twice: once
+as is, and once with its slots dataclasses swapped for copies that keep their
+fields in a __dict__, as they used to. Everything the parse keeps alive is
+counted, e.g. a day 2 record is a game along with its rounds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import tracemalloc
+from types import ModuleType
+from typing import Callable, Iterator, NamedTuple
+
+from bench.generators import GENERATORS
+from support import solvers
+
+# The parsed structure, which must stay alive while it's measured, and how
+# many records it holds
+Parse = Callable[[ModuleType, str], tuple[object, int]]
+
+
+class Case(NamedTuple):
+    classes: tuple[str, ...]
+    record: str
+    size: int
+    parse: Parse
+
+
+def parse_lines(parse_line: str) -> Parse:
+    def parse(module: ModuleType, input_data: str) -> tuple[object, int]:
+        records = [
+            getattr(module, parse_line)(line) for line in input_data.splitlines()
+        ]
+        return records, len(records)
+
+    return parse
+
+
+def parse_schematic(module: ModuleType, input_data: str) -> tuple[object, int]:
+    schematic = module.parse_schematic(input_data)
+    return schematic, len(schematic.numbers) + len(schematic.symbols)
+
+
+def parse_almanac(module: ModuleType, input_data: str) -> tuple[object, int]:
+    entries = sum(line[:1].isdigit() for line in input_data.splitlines()[1:])
+    return module.parse_almanac(input_data), entries
+
+
+CASES: dict[str, Case] = {
+    "day02": Case(
+        ("Game", "CubeCollection"), "game", 20_000, parse_lines("parse_game")
+    ),
+    "day03": Case(
+        ("SchematicNumber", "SchematicSymbol", "Box"),
+        "number or symbol",
+        300,
+        parse_schematic,
+    ),
+    "day04": Case(("Card",), "card", 20_000, parse_lines("parse_card")),
+    "day05": Case(
+        ("IntervalTreeNode", "AlmanacMapEntry"), "map entry", 5_000, parse_almanac
+    ),
+}
+
+
+def without_slots(cls: type) -> type:
+    """A copy of a slots dataclass that keeps its fields in a __dict__"""
+
+    slots = set(getattr(cls, "__slots__", ()))
+    namespace = {
+        name: value
+        for name, value in vars(cls).items()
+        if name not in slots and name != "__slots__"
+    }
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+@contextlib.contextmanager
+def swapped_without_slots(
+    module: ModuleType, classes: tuple[str, ...]
+) -> Iterator[None]:
+    originals = {name: getattr(module, name) for name in classes}
+    try:
+        for name, cls in originals.items():
+            setattr(module, name, without_slots(cls))
+        yield
+    finally:
+        for name, cls in originals.items():
+            setattr(module, name, cls)
+
+
+def bytes_per_record(parse: Parse, module: ModuleType, input_data: str) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        parsed, records = parse(module, input_data)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del parsed
+    return size / records
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("days", nargs="*", help="e.g. day05 (default: all)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for day, case in CASES.items():
+        if args.days and day not in args.days:
+            continue
+        module = solvers.load_module(f"{day}.common")
+        input_data = GENERATORS[day].generate(case.size, args.seed)
+
+        with swapped_without_slots(module, case.classes):
+            before = bytes_per_record(case.parse, module, input_data)
+        after = bytes_per_record(case.parse, module, input_data)
+
+        print(
+            f"{day} per {case.record:<17} {before:8.1f}B with __dict__ "
+            f"{after:8.1f}B with slots  {after / before - 1:+6.1%}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,166 @@
+"""Fail if any solver got slower than its recorded baseline
+
+    $ python -m bench.regression
+    $ python -m bench.regression --threshold 0.25 day05
+    $ python -m bench.regression --update
+
+Every solve_for is timed against a generated reference input. A solver has
+regressed when its best time is more than --threshold slower than the
+baseline's, and the difference is also well outside the run-to-run noise
+(median absolute deviation) of both measurements. The best of several runs
+is compared because it is the least disturbed by whatever else the machine
+is doing. A solver that raises, that has a baseline but no longer exists, or
+that exists but has no baseline (record one with --update), fails the gate
+too.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os.path
+import statistics
+import timeit
+from typing import NamedTuple
+
+from bench.generators import GENERATORS
+from support import memoize, solvers
+
+BASELINE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baseline.json"
+)
+
+# Reference inputs are each day's second benchmark size: big enough to
+# measure, small enough to repeat
+REFERENCE_SIZE_INDEX = 1
+REFERENCE_SEED = 0
+
+# How many MADs a slowdown must exceed to not be put down to noise
+NOISE_FACTOR = 3
+
+
+class Timing(NamedTuple):
+    size: int
+    best: float
+    median: float
+    mad: float
+
+
+def measure(module_name: str, size: int, repeat: int) -> Timing:
+    day, _, _ = module_name.partition(".")
+    input_data = GENERATORS[day].generate(size, REFERENCE_SEED)
+    solver = solvers.load(module_name)
+
+    def solve() -> None:
+        # Module-level memos would otherwise stay warm from the previous run
+        memoize.clear()
+        solver(input_data)
+
+    timer = timeit.Timer(solve)
+    # Loop enough times per sample that timer resolution doesn't matter
+    number, _ = timer.autorange()
+    samples = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+
+    median = statistics.median(samples)
+    mad = statistics.median(abs(s - median) for s in samples)
+    return Timing(size, min(samples), median, mad)
+
+
+def is_regression(baseline: Timing, current: Timing, threshold: float) -> bool:
+    slowdown = current.best - baseline.best
+    return slowdown > baseline.best * threshold and slowdown > NOISE_FACTOR * (
+        baseline.mad + current.mad
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("days", nargs="*", help="e.g. day05 (default: all)")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.3,
+        help="fractional slowdown that fails the gate (default: 0.3, i.e. 30%%)",
+    )
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument(
+        "--update", action="store_true", help="record the timings as the baseline"
+    )
+    args = parser.parse_args()
+
+    baselines: dict[str, Timing] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baselines = {name: Timing(**t) for name, t in json.load(f).items()}
+
+    regressions = []
+    # Solvers that raised, baselined solvers that weren't run at all, and
+    # solvers that were run but have nothing to compare against
+    failures = []
+    timings: dict[str, Timing] = {}
+    module_names = [
+        name for name in solvers.discover(args.days) if name.split(".")[0] in GENERATORS
+    ]
+    for module_name in sorted(baselines.keys() - module_names):
+        day, _, _ = module_name.partition(".")
+        if not args.days or day in args.days:
+            print(f"{module_name:<12} MISSING, in the baseline but not found")
+            failures.append(module_name)
+
+    for module_name in module_names:
+        day, _, _ = module_name.partition(".")
+        baseline = baselines.get(module_name)
+        size = (
+            baseline.size
+            if baseline and not args.update
+            else GENERATORS[day].sizes[REFERENCE_SIZE_INDEX]
+        )
+
+        try:
+            current = timings[module_name] = measure(module_name, size, args.repeat)
+        except Exception as e:
+            print(f"{module_name:<12} ERROR: {e!r}")
+            failures.append(module_name)
+            continue
+
+        if args.update:
+            status = "recorded"
+        elif not baseline:
+            failures.append(module_name)
+            status = "NO BASELINE, record one with --update"
+        else:
+            change = current.best / baseline.best - 1
+            if is_regression(baseline, current, args.threshold):
+                regressions.append(module_name)
+                status = f"REGRESSED {change:+.1%}"
+            else:
+                status = f"ok {change:+.1%}"
+        print(
+            f"{module_name:<12} {current.best * 1000:10.3f}ms "
+            f"(median {current.median * 1000:.3f}ms ±{current.mad * 1000:.3f}ms)  "
+            f"{status}"
+        )
+
+    if failures:
+        print(f"{len(failures)} failure(s): {', '.join(failures)}")
+
+    if args.update:
+        baselines.update(timings)
+        with open(args.baseline, "w") as f:
+            json.dump(
+                {name: t._asdict() for name, t in sorted(baselines.items())},
+                f,
+                indent=2,
+            )
+            f.write("\n")
+        print(f"wrote {args.baseline}")
+        return 1 if failures else 0
+
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+    return 1 if regressions or failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
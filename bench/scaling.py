@@ -0,0 +1,83 @@
+"""Time every solve_for against generated inputs of increasing size
+
+    $ python -m bench.scaling
+    $ python -m bench.scaling day03 day11 --budget 5
+
+Scaling curves are written to bench/results/scaling.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os.path
+import time
+from typing import Any
+
+from bench.generators import GENERATORS
+from support import memoize, solvers
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def time_solver(module_name: str, input_data: str, repeat: int) -> float:
+    """Best of `repeat` wall times for one solve"""
+
+    solver = solvers.load(module_name)
+    best = float("inf")
+    for _ in range(repeat):
+        # Module-level memos would otherwise stay warm from the previous run
+        memoize.clear()
+        start = time.perf_counter()
+        solver(input_data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("days", nargs="*", help="e.g. day05 (default: all)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=2.0,
+        help="stop growing a solver's input once one solve takes this many seconds",
+    )
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "scaling.json"))
+    args = parser.parse_args()
+
+    curves: dict[str, list[dict[str, Any]]] = {}
+    for module_name in solvers.discover(args.days):
+        day, _, _ = module_name.partition(".")
+        if day not in GENERATORS:
+            continue
+        generator = GENERATORS[day]
+        curve = curves[module_name] = []
+        for size in generator.sizes:
+            input_data = generator.generate(size, args.seed)
+            try:
+                elapsed = time_solver(module_name, input_data, args.repeat)
+            except Exception as e:
+                print(f"{module_name:<12} {size:>8} {generator.unit:<16} error: {e!r}")
+                break
+            curve.append({"size": size, "seconds": elapsed})
+            print(
+                f"{module_name:<12} {size:>8} {generator.unit:<16} "
+                f"{elapsed * 1000:10.2f}ms"
+            )
+            if elapsed > args.budget:
+                print(f"{module_name:<12} over budget, not growing further")
+                break
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(curves, f, indent=2)
+    print(f"wrote {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
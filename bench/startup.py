@@ -0,0 +1,68 @@
+"""Measure how much production startup saves by not importing pytest
+
+    $ python -m bench.startup
+    $ python -m bench.startup day05.part1 --runs 50
+
+Each run solves a tiny input with the result cache disabled, so the time is
+almost all interpreter startup and imports.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from support import solvers
+
+# What every solver module used to pay for at import time
+WITH_PYTEST = (
+    "import pytest, runpy, sys; "
+    "sys.argv[0] = {module!r}; "
+    "runpy.run_module({module!r}, run_name='__main__', alter_sys=True)"
+)
+
+
+def time_command(command: list[str], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, cwd=solvers.ROOT_DIR, capture_output=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("module", nargs="?", default="day01.part1")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write(solvers.load_module(args.module).EXAMPLE_1)
+    try:
+        arguments = [f.name, "--no-cache"]
+        production = time_command(
+            [sys.executable, "-m", args.module, *arguments], args.runs
+        )
+        with_pytest = time_command(
+            [sys.executable, "-c", WITH_PYTEST.format(module=args.module), *arguments],
+            args.runs,
+        )
+    finally:
+        os.remove(f.name)
+
+    print(f"{args.module} median of {args.runs} runs")
+    print(f"  production:          {production * 1000:8.1f}ms")
+    print(f"  with pytest import:  {with_pytest * 1000:8.1f}ms")
+    print(f"  saved:               {(with_pytest - production) * 1000:8.1f}ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
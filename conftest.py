@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import pytest
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize tests decorated with support.examples"""
+
+    examples = getattr(metafunc.function, "examples", None)
+    if examples is None:
+        return
+
+    marks = []
+    if skip_reason := getattr(metafunc.function, "skip_reason", None):
+        marks.append(pytest.mark.skip(skip_reason))
+
+    metafunc.parametrize(
+        "input_data,expected",
+        [pytest.param(*example, marks=marks) for example in examples],
+    )
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import pytest
-
 import support
 
 
@@ -26,11 +24,8 @@ EXAMPLE_1 = """\
 EXPECTED_1 = 0
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
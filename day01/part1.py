@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
-import pytest
+from typing import Iterable
 
 import support
 
 
 def solve_for(input_data: str) -> int:
-    calibration_values = (
-        parse_calibration_value(line) for line in input_data.splitlines()
-    )
+    return solve_lines(input_data.splitlines())
+
+
+def solve_lines(lines: Iterable[str]) -> int:
+    calibration_values = (parse_calibration_value(line) for line in lines)
 
     return sum(calibration_values)
 
 
+combine = sum
+
+
 def parse_calibration_value(line: str) -> int:
     digits = [c for c in line if c.isdigit()]
     return int(digits[0] + digits[-1])
@@ -29,15 +34,22 @@ treb7uchet
 EXPECTED_1 = 142
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
 
 
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
+    (EXAMPLE_1.rstrip("\n"), EXPECTED_1),
+)
+def test_example_followed(input_data, expected):
+    from support import follow
+
+    assert follow.first_total(input_data, solve_lines, combine) == expected
+
+
 if __name__ == "__main__":
     support.cli(__file__, solve_for)
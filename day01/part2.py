@@ -3,8 +3,7 @@
 from __future__ import annotations
 
 import re
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -21,25 +20,30 @@ WORDS_TO_DIGITS = {
 }
 
 DIGIT_PATTERN = "|".join([*WORDS_TO_DIGITS.keys(), r"[0-9]"])
+# Use lookahead (?=...) to get overlapping matches
+OVERLAPPING_DIGITS_PATTERN = re.compile(rf"(?=({DIGIT_PATTERN}))")
 
 
 def solve_for(input_data: str) -> int:
-    calibration_values = (
-        parse_calibration_value(line) for line in input_data.splitlines()
-    )
+    return solve_lines(input_data.splitlines())
+
+
+def solve_lines(lines: Iterable[str]) -> int:
+    calibration_values = (parse_calibration_value(line) for line in lines)
 
     return sum(calibration_values)
 
 
+combine = sum
+
+
 def parse_calibration_value(line: str) -> int:
     digits = find_digits(line)
     return int(translate_digit(digits[0]) + translate_digit(digits[-1]))
 
 
 def find_digits(line: str) -> list[str]:
-    # Use lookahead (?=...) to get overlapping matches
-    overlapping_digits_pattern = re.compile(rf"(?=({DIGIT_PATTERN}))")
-    return overlapping_digits_pattern.findall(line)
+    return OVERLAPPING_DIGITS_PATTERN.findall(line)
 
 
 def translate_digit(digit: str) -> str:
@@ -61,16 +65,23 @@ EXAMPLE_2 = "91twonelt"
 EXPECTED_2 = 91
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-        (EXAMPLE_2, EXPECTED_2),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
+    (EXAMPLE_2, EXPECTED_2),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
 
 
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
+    (EXAMPLE_2, EXPECTED_2),
+)
+def test_example_followed(input_data, expected):
+    from support import follow
+
+    assert follow.first_total(input_data, solve_lines, combine) == expected
+
+
 if __name__ == "__main__":
     support.cli(__file__, solve_for)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Game:
     id: int
     rounds: list[CubeCollection]
@@ -12,7 +12,7 @@ class Game:
         return all(bag.contains(round) for round in self.rounds)
 
 
-@dataclass
+@dataclass(slots=True)
 class CubeCollection:
     red: int = 0
     green: int = 0
@@ -30,6 +30,10 @@ class CubeCollection:
         )
 
 
+def parse_games(input_data: str) -> list[Game]:
+    return [parse_game(line) for line in input_data.splitlines()]
+
+
 def parse_game(input: str) -> Game:
     raw_game, _, raw_rounds = input.partition(":")
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import pytest
+from typing import Iterable
 
 import support
 
@@ -10,9 +10,21 @@ from . import common
 
 
 def solve_for(input_data: str) -> int:
+    return solve_lines(input_data.splitlines())
+
+
+def solve_lines(lines: Iterable[str]) -> int:
+    return solve_parsed(common.parse_game(line) for line in lines)
+
+
+combine = sum
+
+parse = common.parse_games
+
+
+def solve_parsed(games: Iterable[common.Game]) -> int:
     bag = common.CubeCollection(red=12, green=13, blue=14)
 
-    games = (common.parse_game(line) for line in input_data.splitlines())
     return sum(game.id for game in games if game.is_valid_for(bag))
 
 
@@ -26,15 +38,21 @@ Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green
 EXPECTED_1 = 8
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
 
 
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
+)
+def test_example_followed(input_data, expected):
+    from support import follow
+
+    assert follow.first_total(input_data, solve_lines, combine) == expected
+
+
 if __name__ == "__main__":
     support.cli(__file__, solve_for)
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from functools import cached_property
+from dataclasses import dataclass, field
 from typing import Generator, NamedTuple
 
+import support
+
 GEAR_SYMBOL = "*"
-NUMBER_OR_SYMBOL = re.compile(r"([0-9]+|[^.])")
+NUMBER_OR_SYMBOL = re.compile(rb"([0-9]+|[^.\r\n])")
 
 
 @dataclass
@@ -39,17 +40,14 @@ class Schematic:
                 )
 
 
-@dataclass
+@dataclass(slots=True)
 class SchematicNumber:
     value: int
     bounding_box: Box
+    _adjacency_box: Box = field(init=False, repr=False, compare=False)
 
-    def is_adjacent_to(self, symbol: SchematicSymbol) -> bool:
-        return self._adjacency_box.contains(symbol.position)
-
-    @cached_property
-    def _adjacency_box(self) -> Box:
-        return Box(
+    def __post_init__(self) -> None:
+        self._adjacency_box = Box(
             position=Point(
                 x=self.bounding_box.position.x - 1,
                 y=self.bounding_box.position.y - 1,
@@ -58,8 +56,11 @@ class SchematicNumber:
             height=self.bounding_box.height + 2,
         )
 
+    def is_adjacent_to(self, symbol: SchematicSymbol) -> bool:
+        return self._adjacency_box.contains(symbol.position)
 
-@dataclass
+
+@dataclass(slots=True)
 class SchematicSymbol:
     value: str
     position: Point
@@ -76,7 +77,7 @@ class Gear:
         return self.part_number_1.value * self.part_number_2.value
 
 
-@dataclass
+@dataclass(slots=True)
 class Box:
     position: Point
     width: int
@@ -109,25 +110,25 @@ class Point(NamedTuple):
     y: int
 
 
+@support.cached_parse
 def parse_schematic(
     schematic: str,
 ) -> Schematic:
+    grid = support.Grid.from_str(schematic)
     numbers = []
     symbols = []
-    for row_index, row in enumerate(schematic.splitlines()):
-        for match in NUMBER_OR_SYMBOL.finditer(row):
-            position = Point(x=match.start(), y=row_index)
-            if match[0].isdigit():
-                numbers.append(
-                    SchematicNumber(
-                        value=int(match[0]),
-                        bounding_box=Box(
-                            position=position, width=len(match[0]), height=1
-                        ),
-                    )
+    # Matches can't span rows, as the newline ending each row never matches
+    for match in NUMBER_OR_SYMBOL.finditer(grid.data):
+        position = Point(*grid.xy(match.start()))
+        if match[0].isdigit():
+            numbers.append(
+                SchematicNumber(
+                    value=int(match[0]),
+                    bounding_box=Box(position=position, width=len(match[0]), height=1),
                 )
-            elif is_symbol(match[0]):
-                symbols.append(SchematicSymbol(value=match[0], position=position))
+            )
+        elif is_symbol(char := match[0].decode()):
+            symbols.append(SchematicSymbol(value=char, position=position))
     return Schematic(numbers, symbols)
 
 
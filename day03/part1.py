@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
-import pytest
-
 import support
 
 from . import common
 
 
 def solve_for(input_data: str) -> int:
-    schematic = common.parse_schematic(input_data)
+    with support.phase("parse"):
+        schematic = parse(input_data)
+
+    return solve_parsed(schematic)
+
+
+parse = common.parse_schematic
+
 
+def solve_parsed(schematic: common.Schematic) -> int:
     return sum(part_number.value for part_number in schematic.part_numbers)
 
 
@@ -30,11 +36,9 @@ EXAMPLE_1 = """\
 EXPECTED_1 = 4361
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
+    (EXAMPLE_1.replace("\n", "\r\n"), EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Generator
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Card:
     id: int
     winning_numbers: frozenset[int]
@@ -20,20 +19,16 @@ class Card:
         return [number for number in self.numbers if number in self.winning_numbers]
 
 
-def parse_card(line: str) -> Card:
-    card, numbers = line.split(":")
-    _, card_id = card.split()
+def parse_cards(input_data: str) -> list[Card]:
+    return [parse_card(line) for line in input_data.splitlines()]
+
 
-    winning_numbers_raw, card_numbers_raw = numbers.split("|")
-    winning_numbers = parse_numbers(winning_numbers_raw)
-    card_numbers = parse_numbers(card_numbers_raw)
+def parse_card(line: str) -> Card:
+    card, _, numbers = line.partition(":")
+    winning_numbers_raw, _, card_numbers_raw = numbers.partition("|")
 
     return Card(
-        id=int(card_id),
-        numbers=tuple(card_numbers),
-        winning_numbers=frozenset(winning_numbers),
+        id=int(card.removeprefix("Card")),
+        numbers=tuple(map(int, card_numbers_raw.split())),
+        winning_numbers=frozenset(map(int, winning_numbers_raw.split())),
     )
-
-
-def parse_numbers(s: str) -> Generator[int, None, None]:
-    return (int(number) for number in s.split())
@@ -1,7 +1,7 @@
 # https://adventofcode.com/2023/day/4
 from __future__ import annotations
 
-import pytest
+from typing import Iterable
 
 import support
 
@@ -9,8 +9,19 @@ from . import common
 
 
 def solve_for(input_data: str) -> int:
-    cards = (common.parse_card(line) for line in input_data.splitlines())
+    return solve_lines(input_data.splitlines())
 
+
+def solve_lines(lines: Iterable[str]) -> int:
+    return solve_parsed(common.parse_card(line) for line in lines)
+
+
+combine = sum
+
+parse = common.parse_cards
+
+
+def solve_parsed(cards: Iterable[common.Card]) -> int:
     return sum(card.points for card in cards)
 
 
@@ -25,15 +36,21 @@ Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11
 EXPECTED_1 = 13
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
 
 
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
+)
+def test_example_followed(input_data, expected):
+    from support import follow
+
+    assert follow.first_total(input_data, solve_lines, combine) == expected
+
+
 if __name__ == "__main__":
     support.cli(__file__, solve_for)
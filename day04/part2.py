@@ -3,15 +3,22 @@ from __future__ import annotations
 
 from collections import Counter
 
-import pytest
-
 import support
 
 from . import common
 
 
 def solve_for(input_data: str) -> int:
-    cards = [common.parse_card(line) for line in input_data.splitlines()]
+    with support.phase("parse"):
+        cards = parse(input_data)
+
+    return solve_parsed(cards)
+
+
+parse = common.parse_cards
+
+
+def solve_parsed(cards: list[common.Card]) -> int:
     card_counts = Counter(cards)
 
     for card, count in card_counts.items():
@@ -33,11 +40,8 @@ Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11
 EXPECTED_1 = 30
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
+import support
+
 T = TypeVar("T")
 
 
@@ -33,6 +35,10 @@ class IntervalTree(Generic[T]):
     def search(self, key: int) -> T | None:
         if not self.root:
             return None
+        elif support.stats.enabled:
+            value, depth = self._search_with_depth(self.root, key, 1)
+            support.stats.observe("day05.interval_tree.search_depth", depth)
+            return value
         else:
             return self._search(self.root, key)
 
@@ -43,6 +49,20 @@ class IntervalTree(Generic[T]):
             return self._search(node.right, key) if node.right else None
         return node.value
 
+    def _search_with_depth(
+        self, node: IntervalTreeNode[T], key: int, depth: int
+    ) -> tuple[T | None, int]:
+        """_search, also counting the nodes visited, for --stats"""
+        if key < node.interval.start:
+            if node.left:
+                return self._search_with_depth(node.left, key, depth + 1)
+            return None, depth
+        if key >= node.interval.stop:
+            if node.right:
+                return self._search_with_depth(node.right, key, depth + 1)
+            return None, depth
+        return node.value, depth
+
     def search_by_range(self, key: range) -> T | None:
         """Return first range found that intersects with key"""
         if not self.root:
@@ -58,7 +78,7 @@ class IntervalTree(Generic[T]):
         return node.value
 
 
-@dataclass
+@dataclass(slots=True)
 class IntervalTreeNode(Generic[T]):
     interval: range
     value: T
@@ -66,8 +86,10 @@ class IntervalTreeNode(Generic[T]):
     right: IntervalTreeNode[T] | None = None
 
 
-@dataclass
+# Compared by identity, so an almanac can be part of a memo's key
+@dataclass(eq=False)
 class Almanac:
+    seeds: list[int]
     maps: dict[str, AlmanacMap]
 
     def find_dest(self, src_category: str, src: int, dest_category: str) -> int:
@@ -135,7 +157,7 @@ class AlmanacMap:
         return results
 
 
-@dataclass
+@dataclass(slots=True)
 class AlmanacMapEntry:
     dest_range: range
     src_range: range
@@ -151,30 +173,31 @@ class AlmanacMapEntry:
         return None
 
 
+@support.cached_parse
 def parse_almanac(s: str) -> Almanac:
-    _, *maps_s = s.split("\n\n")
+    seeds_s, *maps_s = s.split("\n\n")
 
+    seeds = support.ints(seeds_s).tolist()
     parsed_maps = [parse_map(map) for map in maps_s]
     maps = {map.src_category: map for map in parsed_maps}
 
-    return Almanac(maps)
+    return Almanac(seeds, maps)
 
 
 def parse_map(s: str) -> AlmanacMap:
-    category_line, *entry_lines = s.splitlines()
+    category_line, _, entry_lines = s.partition("\n")
     src_category, dest_category = category_line.split()[0].split("-to-")
     entries: IntervalTree[AlmanacMapEntry] = IntervalTree()
-    parsed_entries = (parse_entry(line) for line in entry_lines)
-    for entry in parsed_entries:
+    # Every entry's numbers in one call, three to an entry
+    numbers = support.ints(entry_lines)
+    for dest_start, src_start, range_len in zip(
+        numbers[0::3], numbers[1::3], numbers[2::3]
+    ):
+        entry = AlmanacMapEntry(src_start, dest_start, range_len)
         entries.insert(entry.src_range, entry)
     return AlmanacMap(src_category, dest_category, entries)
 
 
-def parse_entry(s: str) -> AlmanacMapEntry:
-    dest_start, src_start, range_len = (int(i) for i in s.split())
-    return AlmanacMapEntry(src_start, dest_start, range_len)
-
-
 def merge_ranges(ranges: list[range]) -> list[range]:
     merged_ranges: list[range] = []
     for range_ in sorted_ranges(ranges):
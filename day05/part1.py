@@ -2,27 +2,31 @@
 
 from __future__ import annotations
 
-import pytest
-
 import support
 
 from . import common
 
 
 def solve_for(input_data: str) -> int:
-    seeds = parse_seeds(input_data)
-    almanac = common.parse_almanac(input_data)
+    with support.phase("parse"):
+        almanac = parse(input_data)
+
+    return solve_parsed(almanac)
+
+
+parse = common.parse_almanac
 
-    locations = []
-    for seed in seeds:
-        locations.append(almanac.find_dest("seed", seed, "location"))
 
-    return min(locations)
+def solve_parsed(almanac: common.Almanac) -> int:
+    # Forget the last almanac's locations rather than keep it alive
+    find_location.clear()
+    return min(find_location(almanac, seed) for seed in almanac.seeds)
 
 
-def parse_seeds(s: str) -> list[int]:
-    _, *seeds = s.splitlines()[0].split()
-    return [int(seed) for seed in seeds]
+# Seeds may repeat, and each is looked up through every map
+@support.memo()
+def find_location(almanac: common.Almanac, seed: int) -> int:
+    return almanac.find_dest("seed", seed, "location")
 
 
 EXAMPLE_1 = """\
@@ -63,11 +67,8 @@ humidity-to-location map:
 EXPECTED_1 = 35
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
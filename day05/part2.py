@@ -8,19 +8,24 @@ from __future__ import annotations
 import itertools
 from typing import Generator
 
-import pytest
-
 import support
 
 from . import common
 
 
 def solve_for(input_data: str) -> int:
-    almanac = common.parse_almanac(input_data)
-    seed_ranges = parse_seed_ranges(input_data)
+    with support.phase("parse"):
+        almanac = parse(input_data)
+
+    return solve_parsed(almanac)
+
+
+parse = common.parse_almanac
+
 
+def solve_parsed(almanac: common.Almanac) -> int:
     locations = []
-    for seed_range in seed_ranges:
+    for seed_range in get_seed_ranges(almanac.seeds):
         locations.extend(
             almanac.find_dest_by_range(
                 src_category="seed",
@@ -32,10 +37,9 @@ def solve_for(input_data: str) -> int:
     return min(location.start for location in locations)
 
 
-def parse_seed_ranges(s: str) -> Generator[range, None, None]:
-    _, *seeds = s.splitlines()[0].split()
+def get_seed_ranges(seeds: list[int]) -> Generator[range, None, None]:
     for start, range_length in itertools.batched(seeds, 2):
-        yield range(int(start), int(start) + int(range_length))
+        yield range(start, start + range_length)
 
 
 EXAMPLE_1 = """\
@@ -76,11 +80,8 @@ humidity-to-location map:
 EXPECTED_1 = 46
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
@@ -4,8 +4,6 @@ from __future__ import annotations
 import math
 from typing import Generator, NamedTuple
 
-import pytest
-
 import support
 
 
@@ -26,12 +24,11 @@ def solve_for(input_data: str) -> int:
 
 def parse_races(s: str) -> Generator[Race, None, None]:
     unparsed_durations, unparsed_distances = s.splitlines()
-    durations = unparsed_durations.split(":")[1].split()
-    distances = unparsed_distances.split(":")[1].split()
+    durations = support.ints(unparsed_durations)
+    distances = support.ints(unparsed_distances)
 
     return (
-        Race(int(duration), int(distance))
-        for duration, distance in zip(durations, distances)
+        Race(duration, distance) for duration, distance in zip(durations, distances)
     )
 
 
@@ -75,11 +72,8 @@ Distance:  9  40  200
 EXPECTED_1 = 288
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
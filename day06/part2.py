@@ -4,8 +4,6 @@ from __future__ import annotations
 import math
 from typing import NamedTuple
 
-import pytest
-
 import support
 
 
@@ -51,11 +49,8 @@ Distance:  9  40  200
 EXPECTED_1 = 71503
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
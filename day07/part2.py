@@ -6,8 +6,6 @@ from dataclasses import dataclass
 from enum import IntEnum, auto
 from functools import cached_property
 
-import pytest
-
 import support
 
 Card = IntEnum("Card", "J 2 3 4 5 6 7 8 9 T Q K A")
@@ -29,28 +27,8 @@ class Hand:
 
     @cached_property
     def type(self) -> HandType:
-        card_counts = Counter[Card](self.cards)
-
-        if len(card_counts) > 1:
-            joker_count = card_counts.pop(Card.J, 0)
-            [(most_common_card, _)] = card_counts.most_common(1)
-            card_counts.update({most_common_card: joker_count})
-
-        match card_counts.most_common():
-            case (_, 5), _:
-                return HandType.FIVE_OF_A_KIND
-            case (_, 4), _:
-                return HandType.FOUR_OF_A_KIND
-            case (_, 3), (_, 2):
-                return HandType.FULL_HOUSE
-            case (_, 3), *_:
-                return HandType.THREE_OF_A_KIND
-            case (_, 2), (_, 2), _:
-                return HandType.TWO_PAIR
-            case (_, 2), *_:
-                return HandType.ONE_PAIR
-            case _:
-                return HandType.HIGH_CARD
+        # The type only depends on which cards, so share it between orders
+        return classify(tuple(sorted(self.cards)))
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Hand):
@@ -67,6 +45,32 @@ class Hand:
         return self.type < other.type
 
 
+@support.memo(maxsize=8192, persist=True)
+def classify(cards: tuple[Card, ...]) -> HandType:
+    card_counts = Counter[Card](cards)
+
+    if len(card_counts) > 1:
+        joker_count = card_counts.pop(Card.J, 0)
+        [(most_common_card, _)] = card_counts.most_common(1)
+        card_counts.update({most_common_card: joker_count})
+
+    match card_counts.most_common():
+        case (_, 5), _:
+            return HandType.FIVE_OF_A_KIND
+        case (_, 4), _:
+            return HandType.FOUR_OF_A_KIND
+        case (_, 3), (_, 2):
+            return HandType.FULL_HOUSE
+        case (_, 3), *_:
+            return HandType.THREE_OF_A_KIND
+        case (_, 2), (_, 2), _:
+            return HandType.TWO_PAIR
+        case (_, 2), *_:
+            return HandType.ONE_PAIR
+        case _:
+            return HandType.HIGH_CARD
+
+
 def solve_for(input_data: str) -> int:
     hand_bids = [parse_hand_and_bid(line) for line in input_data.splitlines()]
     hand_bids.sort()
@@ -89,11 +93,8 @@ QQQJA 483
 EXPECTED_1 = 5905
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
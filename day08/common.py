@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+import support
+
+NODE_PATTERN = re.compile(r"([A-Z0-9]{3}) = \(([A-Z0-9]{3}), ([A-Z0-9]{3})\)")
+
+
+class NetworkNode(NamedTuple):
+    label: str
+    left: str
+    right: str
+
+
+Network = dict[str, NetworkNode]
+
+
+@support.cached_parse
+def parse_maps(input_data: str) -> tuple[str, Network]:
+    instructions, network_s = input_data.split("\n\n")
+
+    parsed_nodes = (parse_node(line) for line in network_s.splitlines())
+
+    return instructions, {node.label: node for node in parsed_nodes}
+
+
+def parse_node(s: str) -> NetworkNode:
+    match = NODE_PATTERN.match(s)
+    if not match:
+        raise ValueError(f"Could not parse node from '{s}'")
+    label, left, right = match.groups()
+    return NetworkNode(label, left, right)
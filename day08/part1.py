@@ -3,31 +3,27 @@
 from __future__ import annotations
 
 import itertools
-import re
-from typing import NamedTuple
-
-import pytest
 
 import support
 
-NODE_PATTERN = re.compile(r"([A-Z]{3}) = \(([A-Z]{3}), ([A-Z]{3})\)")
+from . import common
 
 START_LABEL = "AAA"
 DEST_LABEL = "ZZZ"
 
 
-class NetworkNode(NamedTuple):
-    label: str
-    left: str
-    right: str
+def solve_for(input_data: str) -> int:
+    with support.phase("parse"):
+        maps = parse(input_data)
 
+    return solve_parsed(maps)
 
-def solve_for(input_data: str) -> int:
-    instructions, network_s = input_data.split("\n\n")
 
-    parsed_nodes = (parse_node(line) for line in network_s.splitlines())
+parse = common.parse_maps
 
-    network = {node.label: node for node in parsed_nodes}
+
+def solve_parsed(maps: tuple[str, common.Network]) -> int:
+    instructions, network = maps
     current_node = network[START_LABEL]
     for step, instruction in enumerate(itertools.cycle(instructions), 1):
         if instruction == "L":
@@ -39,17 +35,10 @@ def solve_for(input_data: str) -> int:
         if current_node.label == DEST_LABEL:
             break
 
+    support.stats.incr("day08.steps", step)
     return step
 
 
-def parse_node(s: str) -> NetworkNode:
-    match = NODE_PATTERN.match(s)
-    if not match:
-        raise ValueError(f"Could not parse node from '{s}'")
-    label, left, right = match.groups()
-    return NetworkNode(label, left, right)
-
-
 EXAMPLE_1 = """\
 RL
 
@@ -73,12 +62,9 @@ ZZZ = (ZZZ, ZZZ)
 EXPECTED_2 = 6
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-        (EXAMPLE_2, EXPECTED_2),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
+    (EXAMPLE_2, EXPECTED_2),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
@@ -4,28 +4,24 @@ from __future__ import annotations
 
 import itertools
 import math
-import re
-from typing import NamedTuple
-
-import pytest
 
 import support
 
-NODE_PATTERN = re.compile(r"([A-Z0-9]{3}) = \(([A-Z0-9]{3}), ([A-Z0-9]{3})\)")
+from . import common
 
 
-class NetworkNode(NamedTuple):
-    label: str
-    left: str
-    right: str
+def solve_for(input_data: str) -> int:
+    with support.phase("parse"):
+        maps = parse(input_data)
 
+    return solve_parsed(maps)
 
-def solve_for(input_data: str) -> int:
-    instructions, network_s = input_data.split("\n\n")
 
-    parsed_nodes = (parse_node(line) for line in network_s.splitlines())
+parse = common.parse_maps
 
-    network = {node.label: node for node in parsed_nodes}
+
+def solve_parsed(maps: tuple[str, common.Network]) -> int:
+    instructions, network = maps
     current_nodes = [node for node in network.values() if node.label.endswith("A")]
     steps_required = [-1] * len(current_nodes)
     for step, instruction in enumerate(itertools.cycle(instructions), 1):
@@ -44,17 +40,11 @@ def solve_for(input_data: str) -> int:
         if all(s > 0 for s in steps_required):
             break
 
+    support.stats.incr("day08.steps", step)
+    support.stats.incr("day08.node_steps", step * len(current_nodes))
     return math.lcm(*steps_required)
 
 
-def parse_node(s: str) -> NetworkNode:
-    match = NODE_PATTERN.match(s)
-    if not match:
-        raise ValueError(f"Could not parse node from '{s}'")
-    label, left, right = match.groups()
-    return NetworkNode(label, left, right)
-
-
 EXAMPLE_1 = """\
 LR
 
@@ -70,11 +60,8 @@ XXX = (XXX, XXX)
 EXPECTED_1 = 6
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
@@ -2,20 +2,26 @@
 from __future__ import annotations
 
 import itertools
-
-import pytest
+from typing import Iterable
 
 import support
 
 
 def solve_for(input_data: str) -> int:
-    sequences = (parse_history(line) for line in input_data.splitlines())
+    return solve_lines(input_data.splitlines())
+
+
+def solve_lines(lines: Iterable[str]) -> int:
+    sequences = (parse_history(line) for line in lines)
 
     return sum(predict_next(seq) for seq in sequences)
 
 
+combine = sum
+
+
 def parse_history(line: str) -> list[int]:
-    return [int(c) for c in line.split()]
+    return list(map(int, line.split()))
 
 
 def predict_next(seq: list[int]) -> int:
@@ -41,15 +47,21 @@ EXAMPLE_1 = """\
 EXPECTED_1 = 114
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
 
 
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
+)
+def test_example_followed(input_data, expected):
+    from support import follow
+
+    assert follow.first_total(input_data, solve_lines, combine) == expected
+
+
 if __name__ == "__main__":
     support.cli(__file__, solve_for)
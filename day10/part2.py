@@ -3,10 +3,7 @@
 from __future__ import annotations
 
 from collections import deque
-from dataclasses import dataclass
-from typing import Generator, Literal, NamedTuple
-
-import pytest
+from typing import Literal
 
 import support
 
@@ -18,33 +15,12 @@ CONNECTS_NORTH = ("J", "L", "|")
 CONNECTS_SOUTH = ("7", "F", "|")
 
 
-class Position(NamedTuple):
-    x: int
-    y: int
-
-
-@dataclass
-class Grid:
-    grid: list[tuple[str]]
-
-    def at(self, position: Position) -> str:
-        return self.grid[position.x][position.y]
-
-    def iter_positions(self) -> Generator[Position, None, None]:
-        for x in range(0, len(self.grid)):
-            for y in range(0, len(self.grid[0])):
-                yield Position(x, y)
-
-    @classmethod
-    def from_str(cls, input_data: str) -> Grid:
-        return cls(
-            # transposed so we can address by x, y
-            grid=list(zip(*input_data.splitlines()))
-        )
+# A position is a flat index into a support.Grid
+Position = int
 
 
 def solve_for(input_data: str) -> int:
-    grid = Grid.from_str(input_data)
+    grid = support.Grid.from_str(input_data)
     start_position = find_entry_position(grid)
     assert start_position is not None
 
@@ -59,6 +35,8 @@ def solve_for(input_data: str) -> int:
         # Already visited, first seen distance would have been farthest
         # from beginning
         if current_position in visited:
+            # Every position dequeued was visited, apart from this one
+            support.stats.incr("day10.bfs.dequeued", len(visited) + 1)
             return visited[current_position]
 
         visited[current_position] = distance
@@ -76,18 +54,16 @@ def parse_line(line: str) -> str:
     return line
 
 
-def find_entry_position(grid: Grid) -> Position | None:
-    for position in grid.iter_positions():
-        if grid.at(position) == "S":
-            return position
-    return None
+def find_entry_position(grid: support.Grid) -> Position | None:
+    position = grid.find("S")
+    return position if position >= 0 else None
 
 
-def determine_pipe(grid: Grid, pipe: Position) -> Pipe:
-    connects_north = grid.at(Position(pipe.x, pipe.y - 1)) in CONNECTS_SOUTH
-    connects_south = grid.at(Position(pipe.x, pipe.y + 1)) in CONNECTS_NORTH
-    connects_east = grid.at(Position(pipe.x + 1, pipe.y)) in CONNECTS_WEST
-    connects_west = grid.at(Position(pipe.x - 1, pipe.y)) in CONNECTS_EAST
+def determine_pipe(grid: support.Grid, pipe: Position) -> Pipe:
+    connects_north = grid.get(pipe - grid.stride) in CONNECTS_SOUTH
+    connects_south = grid.get(pipe + grid.stride) in CONNECTS_NORTH
+    connects_east = grid.get(pipe + 1) in CONNECTS_WEST
+    connects_west = grid.get(pipe - 1) in CONNECTS_EAST
 
     if connects_north and connects_south:
         return "|"
@@ -105,41 +81,29 @@ def determine_pipe(grid: Grid, pipe: Position) -> Pipe:
         raise ValueError("Invalid pipe")
 
 
-def find_connections(grid: Grid, pipe: Position) -> list[Position]:
+def find_connections(grid: support.Grid, pipe: Position) -> list[Position]:
     pipe_shape = grid.at(pipe)
     if pipe_shape == "S":
         pipe_shape = determine_pipe(grid, pipe)
-    candidate_connections = []
+
+    north, south = pipe - grid.stride, pipe + grid.stride
+    west, east = pipe - 1, pipe + 1
 
     if pipe_shape == "-":
-        candidate_connections.extend(
-            [Position(pipe.x - 1, pipe.y), Position(pipe.x + 1, pipe.y)]
-        )
+        return [west, east]
     elif pipe_shape == "|":
-        candidate_connections.extend(
-            [Position(pipe.x, pipe.y - 1), Position(pipe.x, pipe.y + 1)]
-        )
+        return [north, south]
     elif pipe_shape == "J":
-        candidate_connections.extend(
-            [Position(pipe.x, pipe.y - 1), Position(pipe.x - 1, pipe.y)]
-        )
+        return [north, west]
     elif pipe_shape == "L":
-        candidate_connections.extend(
-            [Position(pipe.x, pipe.y - 1), Position(pipe.x + 1, pipe.y)]
-        )
+        return [north, east]
     elif pipe_shape == "F":
-        candidate_connections.extend(
-            [Position(pipe.x + 1, pipe.y), Position(pipe.x, pipe.y + 1)]
-        )
+        return [east, south]
     elif pipe_shape == "7":
-        candidate_connections.extend(
-            [Position(pipe.x - 1, pipe.y), Position(pipe.x, pipe.y + 1)]
-        )
+        return [west, south]
     else:
         raise ValueError("Invalid pipe")
 
-    return candidate_connections
-
 
 EXAMPLE_1 = """\
 ...........
@@ -182,15 +146,12 @@ L--J.L7...LJS7F-7L7.
 EXPECTED_3 = 8
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-        (EXAMPLE_2, EXPECTED_2),
-        (EXAMPLE_3, EXPECTED_3),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
+    (EXAMPLE_2, EXPECTED_2),
+    (EXAMPLE_3, EXPECTED_3),
+    skip="Haven't solved this yet",
 )
-@pytest.mark.skip("Haven't solved this yet")
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
 
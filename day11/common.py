@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import itertools
+import json
+from typing import Callable, Iterable, NamedTuple
+
+GALAXY = "#"
+
+
+class GalaxyCounts(NamedTuple):
+    """How many galaxies are in each row and each column of (part of) an image
+
+    Enough to sum the distances between every pair of galaxies, without
+    keeping where each one is.
+    """
+
+    rows: list[int]
+    cols: list[int]
+
+
+def count_galaxies(rows: Iterable[str]) -> GalaxyCounts:
+    row_counts = []
+    col_counts: list[int] = []
+    for row in rows:
+        if len(row) > len(col_counts):
+            col_counts.extend([0] * (len(row) - len(col_counts)))
+        row_counts.append(row.count(GALAXY))
+        x = row.find(GALAXY)
+        while x >= 0:
+            col_counts[x] += 1
+            x = row.find(GALAXY, x + 1)
+    return GalaxyCounts(row_counts, col_counts)
+
+
+def merge_counts(partials: Iterable[Iterable[list[int]]]) -> GalaxyCounts:
+    """Counts for an image from those for consecutive bands of its rows
+
+    Partials may have been through JSON, so are taken as any (rows, cols) pair.
+    """
+
+    row_counts: list[int] = []
+    col_counts: list[int] = []
+    for rows, cols in partials:
+        row_counts.extend(rows)
+        col_counts = [
+            a + b for a, b in itertools.zip_longest(col_counts, cols, fillvalue=0)
+        ]
+    return GalaxyCounts(row_counts, col_counts)
+
+
+def sum_distances(counts: GalaxyCounts, expansion: int) -> int:
+    """Sum of the distances between every pair of galaxies
+
+    Each empty row and column is `expansion` times as wide as it looks.
+    """
+
+    return axis_distance_sum(counts.rows, expansion) + axis_distance_sum(
+        counts.cols, expansion
+    )
+
+
+def axis_distance_sum(counts: list[int], expansion: int) -> int:
+    total = 0
+    seen = 0
+    seen_position_sum = 0
+    position = 0
+    for count in counts:
+        if not count:
+            position += expansion
+            continue
+        # Each of these galaxies is this far past every one seen so far
+        total += count * (seen * position - seen_position_sum)
+        seen += count
+        seen_position_sum += count * position
+        position += 1
+    return total
+
+
+def solve_in_bands(
+    input_data: str, merge_partials: Callable[[Iterable[GalaxyCounts]], int]
+) -> int:
+    """The answer as --shard and --merge give it, for tests
+
+    The image is cut into three bands of rows, one of them a single row, and
+    each band's counts go through JSON before they're merged, in band order.
+    """
+
+    lines = input_data.splitlines()
+    bands = [lines[:3], lines[3:4], lines[4:]]
+    partials = [json.loads(json.dumps(count_galaxies(band))) for band in bands]
+    return merge_partials(partials)
@@ -2,13 +2,20 @@
 from __future__ import annotations
 
 import itertools
-from typing import NamedTuple
-
-import pytest
+import math
+from typing import Iterable, NamedTuple
 
 import support
 
-Image = list[str]
+from . import common
+
+Image = support.Grid
+
+# Grid rows and columns are bytes
+GALAXY_BYTE = ord(common.GALAXY)
+
+# How many times wider than they look empty rows and columns are
+EXPANSION = 2
 
 
 class Coordinate(NamedTuple):
@@ -17,7 +24,7 @@ class Coordinate(NamedTuple):
 
 
 def solve_for(input_data: str) -> int:
-    image = input_data.splitlines()
+    image = support.Grid.from_str(input_data)
     galaxies = find_galaxies(image)
     empty_rows = find_empty_rows(image)
     empty_cols = find_empty_cols(image)
@@ -26,35 +33,41 @@ def solve_for(input_data: str) -> int:
     for a, b in itertools.combinations(galaxies, 2):
         result = space_distance(a, b, empty_rows, empty_cols)
         acc += result
+    support.stats.incr("day11.pairs", math.comb(len(galaxies), 2))
 
     # TODO: implement solution here!
     return acc
 
 
+# For --shard: a shard counts the galaxies in its rows, which is enough to
+# sum the distances once every shard's counts are merged
+solve_partial = common.count_galaxies
+
+
+def merge_partials(partials: Iterable[common.GalaxyCounts]) -> int:
+    return common.sum_distances(common.merge_counts(partials), EXPANSION)
+
+
 def parse_line(line: str) -> str:
     return line
 
 
 def find_galaxies(image: Image) -> tuple[Coordinate, ...]:
-    result = []
-    for y, row in enumerate(image):
-        for x, char in enumerate(row):
-            if char == "#":
-                result.append(Coordinate(x, y))
-    return tuple(result)
+    return tuple(
+        Coordinate(*image.xy(index)) for index in image.find_all(common.GALAXY)
+    )
 
 
 def find_empty_rows(image: Image) -> tuple[int, ...]:
-    return tuple(index for index, row in enumerate(image) if is_empty(row))
+    return tuple(y for y in range(image.height) if is_empty(image.row(y)))
 
 
 def find_empty_cols(image: Image) -> tuple[int, ...]:
-    cols: list[tuple[str]] = list(zip(*image))
-    return tuple(index for index, col in enumerate(cols) if is_empty(col))
+    return tuple(x for x in range(image.width) if is_empty(image.col(x)))
 
 
-def is_empty(row: str | tuple[str]) -> bool:
-    return all(c == "." for c in row)
+def is_empty(line: memoryview) -> bool:
+    return GALAXY_BYTE not in line
 
 
 def manhattan_distance(a: Coordinate, b: Coordinate) -> int:
@@ -69,10 +82,14 @@ def space_distance(
 ) -> int:
     flat_distance = manhattan_distance(a, b)
     empty_rows_between = sum(
-        1 for row in empty_rows if row in range(min(a.y, b.y), max(a.y, b.y))
+        EXPANSION - 1
+        for row in empty_rows
+        if row in range(min(a.y, b.y), max(a.y, b.y))
     )
     empty_cols_between = sum(
-        1 for col in empty_cols if col in range(min(a.x, b.x), max(a.x, b.x))
+        EXPANSION - 1
+        for col in empty_cols
+        if col in range(min(a.x, b.x), max(a.x, b.x))
     )
     return flat_distance + empty_rows_between + empty_cols_between
 
@@ -92,15 +109,19 @@ EXAMPLE_1 = """\
 EXPECTED_1 = 374
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
 
 
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
+)
+def test_example_sharded(input_data, expected):
+    assert common.solve_in_bands(input_data, merge_partials) == expected
+
+
 if __name__ == "__main__":
     support.cli(__file__, solve_for)
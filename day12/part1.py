@@ -1,8 +1,6 @@
 # https://adventofcode.com/2023/day/12
 from __future__ import annotations
 
-import pytest
-
 import support
 
 OPERATIONAL = "."
@@ -34,11 +32,8 @@ EXAMPLE_1 = """\
 EXPECTED_1 = 0
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
@@ -3,16 +3,22 @@
 from __future__ import annotations
 
 from functools import reduce
-
-import pytest
+from typing import Iterable
 
 import support
 
+RECORD_SEPARATOR = ","
+
 
 def solve_for(input_data: str) -> int:
-    steps = input_data.strip().split(",")
+    return solve_lines(input_data.split(RECORD_SEPARATOR))
+
+
+def solve_lines(steps: Iterable[str]) -> int:
+    return sum(reduce(calculate_hash, step.strip(), 0) for step in steps)
+
 
-    return sum(reduce(calculate_hash, step, 0) for step in steps)
+combine = sum
 
 
 def calculate_hash(acc: int, char: str) -> int:
@@ -29,15 +35,24 @@ rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7
 EXPECTED_1 = 1320
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
 
 
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
+)
+def test_example_followed(input_data, expected):
+    from support import follow
+
+    assert (
+        follow.first_total(input_data, solve_lines, combine, RECORD_SEPARATOR)
+        == expected
+    )
+
+
 if __name__ == "__main__":
     support.cli(__file__, solve_for)
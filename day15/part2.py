@@ -5,10 +5,11 @@ import re
 from functools import reduce
 from typing import NamedTuple
 
-import pytest
-
 import support
 
+INSERT_PATTERN = re.compile(r"([a-zA-Z]+)=([0-9]+)")
+REMOVE_PATTERN = re.compile(r"([a-zA-Z]+)\-")
+
 
 class LensBoxes:
     boxes: list[dict[str, int]]
@@ -65,12 +66,10 @@ def solve_for(input_data: str) -> int:
 
 
 def parse_step(line: str) -> Operation:
-    insert_pattern = re.compile(r"([a-zA-Z]+)=([0-9]+)")
-    remove_pattern = re.compile(r"([a-zA-Z]+)\-")
-    if match := insert_pattern.match(line):
+    if match := INSERT_PATTERN.match(line):
         label, focal_length = match.groups()
         return InsertOperation(label, int(focal_length))
-    elif match := remove_pattern.match(line):
+    elif match := REMOVE_PATTERN.match(line):
         [label] = match.groups()
         return RemoveOperation(label)
     else:
@@ -95,11 +94,8 @@ rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7
 EXPECTED_1 = 145
 
 
-@pytest.mark.parametrize(
-    "input_data,expected",
-    [
-        (EXAMPLE_1, EXPECTED_1),
-    ],
+@support.examples(
+    (EXAMPLE_1, EXPECTED_1),
 )
 def test_example(input_data, expected):
     assert solve_for(input_data) == expected
@@ -0,0 +1,467 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import functools
+import io
+import mmap
+import os.path
+import sys
+from types import ModuleType
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    TypeAlias,
+    TypeVar,
+    cast,
+)
+
+from support import compression, memoize
+from support.grid import Grid  # noqa: F401
+from support.instrument import phase, stats
+from support.memoize import memo  # noqa: F401
+from support.parsing import ints, tokens  # noqa: F401
+
+Solver: TypeAlias = Callable[[str], object]
+LineSolver: TypeAlias = Callable[[Iterable[str]], object]
+Buffer: TypeAlias = bytes | mmap.mmap
+Example: TypeAlias = tuple[str, object]
+TestFunction = TypeVar("TestFunction", bound=Callable[..., Any])
+Parsed = TypeVar("Parsed")
+
+STDIN = "-"
+READ_SIZE = 1 << 16
+
+# Files support.cli writes next to inputs, which are never inputs themselves
+REPORT_SUFFIXES = (".prof", ".prof.txt", ".folded", ".partial.json")
+
+# Whether cached_parse and persistent memos use the on-disk cache. Turned on
+# by cli, so tests and benchmarks always really compute
+disk_cache_enabled = False
+
+
+def cli(module_filename: str, solver: Solver) -> int:
+    global disk_cache_enabled
+    module = solver_module(solver)
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "input_files",
+        nargs="*",
+        metavar="input_file",
+        help=(
+            f"files, directories or globs, or {STDIN} to read from stdin "
+            "(default: input.txt next to the solver)"
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="solve this many input files at once, in worker processes",
+    )
+    if hasattr(module, "combine"):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="split each input into chunks of records solved by worker processes",
+        )
+        parser.add_argument(
+            "--follow",
+            action="store_true",
+            help="keep printing the answer as records are appended to the input",
+        )
+    if hasattr(module, "solve_partial") or hasattr(module, "combine"):
+        parser.add_argument(
+            "--shard",
+            metavar="I/N",
+            help=(
+                "solve only the I-th of N shards of each input, writing its partial "
+                "aggregate next to it"
+            ),
+        )
+        parser.add_argument(
+            "--merge",
+            action="store_true",
+            help="print the answer merged from the partial aggregate files given",
+        )
+    if hasattr(module, "solve_parsed"):
+        parser.add_argument(
+            "--both",
+            action="store_true",
+            help="parse each input once and print the answers to both parts",
+        )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always parse and solve, ignoring and not updating the caches",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="run under cProfile, writing a .prof file and report next to the input",
+    )
+    parser.add_argument(
+        "--sample",
+        action="store_true",
+        help=(
+            "sample the stack on a CPU timer, writing collapsed stacks for flame "
+            "graphs next to the input"
+        ),
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="report peak memory and the top allocation sites to stderr",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="dump the solver's counters, timers and histograms to stderr",
+    )
+    parser.add_argument(
+        "--timings",
+        choices=["json"],
+        help=(
+            "write a record of input size, read, parse and solve times and peak "
+            "RSS for each input to stderr"
+        ),
+    )
+    args = parser.parse_args()
+
+    if args.input_files:
+        from support import batch
+
+        try:
+            input_files = batch.expand_inputs(args.input_files)
+        except FileNotFoundError as e:
+            parser.error(str(e))
+    else:
+        input_files = [os.path.join(os.path.dirname(module_filename), "input.txt")]
+
+    workers = getattr(args, "workers", 1)
+
+    if getattr(args, "follow", False):
+        if len(input_files) != 1 or input_files[0] == STDIN:
+            parser.error("--follow needs exactly one input file")
+        if compression.is_compressed(input_files[0]):
+            parser.error("--follow can't follow a compressed input file")
+        from support import follow
+
+        totals = follow.follow(
+            input_files[0],
+            module.solve_lines,
+            module.combine,
+            getattr(module, "RECORD_SEPARATOR", "\n"),
+        )
+        try:
+            for total in totals:
+                print(total, flush=True)
+        except KeyboardInterrupt:
+            pass
+        raise SystemExit(0)
+
+    if getattr(args, "shard", None) or getattr(args, "merge", False):
+        from support import shard
+
+        if args.shard and args.merge:
+            parser.error("--shard and --merge can't be used together")
+        if args.merge:
+            if not args.input_files:
+                parser.error("--merge needs every shard's partial aggregate file")
+            try:
+                print(shard.merge(module, module_filename, input_files))
+            except (ValueError, KeyError) as e:
+                parser.error(f"can't merge: {e}")
+            raise SystemExit(0)
+
+        try:
+            index, shards = shard.parse_spec(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+        if any(f == STDIN or compression.is_compressed(f) for f in input_files):
+            parser.error("--shard needs uncompressed input files, not stdin")
+        for input_file in input_files:
+            print(shard.solve_shard(module, module_filename, input_file, index, shards))
+        raise SystemExit(0)
+
+    solve_both = getattr(args, "both", False)
+    if solve_both:
+        if workers > 1:
+            parser.error("--both can't be used with --workers")
+        from support import both
+
+        try:
+            both.load_parts(module_filename)
+        except ValueError as e:
+            parser.error(str(e))
+        # Each part's answer is cached on its own, as if solved alone
+        part_filenames = both.part_filenames(module_filename)
+        solve_file: Callable[[str], object] = functools.partial(
+            both.solve_both, module_filename
+        )
+    else:
+        part_filenames = [module_filename]
+        solve_file = functools.partial(solve, solver, workers=workers)
+
+    def run(input_file: str) -> object:
+        run_solver: Callable[[], object] = functools.partial(solve_file, input_file)
+        if args.timings:
+            from support import timings
+
+            run_solver = functools.partial(
+                timings.measure, run_solver, module_filename, input_file
+            )
+        if args.profile:
+            from support import profiling
+
+            run_solver = functools.partial(
+                profiling.profile, run_solver, module_filename, input_file
+            )
+        if args.sample:
+            from support import profiling
+
+            run_solver = functools.partial(
+                profiling.sample, run_solver, module_filename, input_file
+            )
+        if args.memory:
+            from support import memory
+
+            run_solver = functools.partial(memory.measure, run_solver)
+        if not args.stats:
+            return run_solver()
+
+        stats.reset()
+        memoize.reset_counters()
+        stats.enabled = True
+        try:
+            with stats.timer("support.solve"):
+                return run_solver()
+        finally:
+            for name, count in memoize.report():
+                stats.incr(name, count)
+            stats.enabled = False
+            print(f"{input_file}:\n{stats.report()}", file=sys.stderr)
+
+    instrumented = (
+        args.profile or args.sample or args.memory or args.stats or args.timings
+    )
+    use_cache = not (args.no_cache or instrumented)
+    disk_cache_enabled = use_cache
+
+    # Every input's answers, and their cache keys, one per part solved
+    answers: dict[str, list[str]] = {}
+    cache_keys: dict[str, list[str]] = {}
+    if use_cache:
+        from support import cache
+
+        for input_file in input_files:
+            if input_file == STDIN:
+                continue
+            cache_keys[input_file] = cache.result_keys(part_filenames, input_file)
+            cached_answers = [
+                cache.results.get(cache_key) for cache_key in cache_keys[input_file]
+            ]
+            if all(answer is not None for answer in cached_answers):
+                answers[input_file] = [
+                    answer.decode() for answer in cached_answers if answer is not None
+                ]
+
+    unsolved = [f for f in input_files if f not in answers]
+    solved: Iterator[object]
+    if len(input_files) == 1:
+        solved = map(run, unsolved)
+    else:
+        from support import batch
+
+        if args.jobs > 1 and not instrumented and STDIN not in unsolved:
+            solved = batch.solve_in_parallel(solve_file, unsolved, args.jobs)
+        else:
+            solved = batch.solve_sequentially(run, unsolved)
+
+    # Inputs whose solver raised, which don't stop the rest of a batch
+    failed = []
+    for input_file in input_files:
+        if input_file not in answers:
+            answer = next(solved)
+            if isinstance(answer, Exception):
+                print(f"{input_file}: error: {answer!r}", file=sys.stderr)
+                failed.append(input_file)
+                continue
+            part_answers = cast(tuple[object, ...], answer) if solve_both else (answer,)
+            answers[input_file] = [str(part_answer) for part_answer in part_answers]
+            if input_file in cache_keys:
+                for cache_key, part_answer in zip(
+                    cache_keys[input_file], answers[input_file]
+                ):
+                    cache.results.put(cache_key, part_answer.encode())
+
+        if len(input_files) == 1:
+            print(" ".join(answers[input_file]))
+        else:
+            print(f"{input_file}: {' '.join(answers[input_file])}")
+
+    if failed:
+        print(f"{len(failed)} of {len(input_files)} inputs failed", file=sys.stderr)
+        raise SystemExit(1)
+    raise SystemExit(0)
+
+
+def solve(solver: Solver, input_file: str, workers: int = 1) -> object:
+    """Run a solver over a file, streaming it if the solver supports that
+
+    With more than one worker, solvers that can combine the answers for
+    chunks of their input are run over chunks in parallel.
+    """
+
+    module = solver_module(solver)
+    line_solver: LineSolver | None = getattr(module, "solve_lines", None)
+    if line_solver:
+        separator = getattr(module, "RECORD_SEPARATOR", "\n")
+        combine = getattr(module, "combine", None)
+        if (
+            workers > 1
+            and combine
+            and input_file != STDIN
+            and not compression.is_compressed(input_file)
+        ):
+            from support import mapreduce
+
+            return mapreduce.map_reduce(
+                input_file, line_solver, combine, separator, workers
+            )
+        return line_solver(iter_lines(input_file, separator))
+
+    with phase("read"):
+        input_data = slurp(input_file)
+    return solver(input_data)
+
+
+def cached_parse(parser: Callable[[str], Parsed]) -> Callable[[str], Parsed]:
+    """Keep what a parser returns for each input in an on-disk cache
+
+    Entries are keyed by the input and the source of the parser's package and
+    of support, so both parts of a day share them and editing the parser, or
+    the support code it uses, invalidates them.
+    """
+
+    @functools.wraps(parser)
+    def cached_parser(input_data: str) -> Parsed:
+        if not disk_cache_enabled:
+            return parser(input_data)
+
+        from support import cache
+
+        return cache.parse(parser, input_data)
+
+    return cached_parser
+
+
+def solver_module(solver: Solver) -> ModuleType:
+    """The module a solver was defined in, which may be __main__"""
+
+    return sys.modules[solver.__module__]
+
+
+def slurp(filename: str) -> str:
+    """Read a whole file into memory, decompressing it if it's compressed"""
+
+    if filename == STDIN:
+        return read_text(stdin_buffer())
+
+    with open(filename, "rb") as f:
+        return read_text(f)
+
+
+def stdin_buffer() -> io.BufferedReader:
+    # Typed as BinaryIO, but stdin is always buffered, even with python -u
+    return cast(io.BufferedReader, sys.stdin.buffer)
+
+
+def read_text(stream: io.BufferedReader) -> str:
+    text = io.TextIOWrapper(compression.decompressing(stream))
+    try:
+        return text.read()
+    finally:
+        # Leave closing the underlying stream (which may be stdin) to the caller
+        text.detach()
+
+
+def iter_lines(filename: str, separator: str = "\n") -> Generator[str, None, None]:
+    """Lazily iterate over the records of a file (or stdin) in constant memory
+
+    Regular files are mmapped. Anything else, including compressed files, is
+    read (and decompressed) a block at a time. Like `str.splitlines`, there
+    is no trailing empty record.
+    """
+
+    if filename == STDIN:
+        yield from iter_stream(compression.decompressing(stdin_buffer()), separator)
+        return
+
+    if compression.is_compressed(filename):
+        with open(filename, "rb") as f:
+            yield from iter_stream(compression.decompressing(f), separator)
+        return
+
+    with map_file(filename) as buffer:
+        yield from iter_records(buffer, separator)
+
+
+@contextlib.contextmanager
+def map_file(filename: str) -> Generator[Buffer, None, None]:
+    """Map a whole file into memory read-only, without reading it"""
+
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def iter_records(
+    buffer: Buffer, separator: str = "\n", start: int = 0, end: int | None = None
+) -> Generator[str, None, None]:
+    sep = separator.encode()
+    end = len(buffer) if end is None else end
+    while start < end:
+        stop = buffer.find(sep, start, end)
+        if stop < 0:
+            stop = end
+        yield buffer[start:stop].decode()
+        start = stop + len(sep)
+
+
+def iter_stream(stream: BinaryIO, separator: str = "\n") -> Generator[str, None, None]:
+    sep = separator.encode()
+    remainder = b""
+    while block := stream.read(READ_SIZE):
+        *records, remainder = (remainder + block).split(sep)
+        for record in records:
+            yield record.decode()
+    if remainder:
+        yield remainder.decode()
+
+
+def examples(
+    *cases: Example, skip: str | None = None
+) -> Callable[[TestFunction], TestFunction]:
+    """Parametrize a test over (input_data, expected) cases
+
+    The parametrizing itself happens in conftest.py, so solver modules never
+    import pytest and production runs don't pay for it.
+    """
+
+    def decorator(test: TestFunction) -> TestFunction:
+        test.examples = cases  # type: ignore[attr-defined]
+        test.skip_reason = skip  # type: ignore[attr-defined]
+        return test
+
+    return decorator
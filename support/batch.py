@@ -0,0 +1,86 @@
+"""Running one solver over many input files"""
+
+from __future__ import annotations
+
+import glob
+import os
+import os.path
+from typing import Callable, Iterator
+
+from support import REPORT_SUFFIXES, STDIN
+
+
+def expand_inputs(patterns: list[str]) -> list[str]:
+    """Expand files, directories and globs into a stable list of input files
+
+    Directories are expanded to the files directly inside them, skipping hidden
+    files and the reports support.cli writes next to inputs.
+    """
+
+    input_files = []
+    for pattern in patterns:
+        if pattern == STDIN or os.path.isfile(pattern):
+            input_files.append(pattern)
+        elif os.path.isdir(pattern):
+            input_files.extend(
+                path
+                for path in sorted(glob.glob(os.path.join(pattern, "*")))
+                if os.path.isfile(path) and not path.endswith(REPORT_SUFFIXES)
+            )
+        elif matches := sorted(glob.glob(pattern)):
+            input_files.extend(matches)
+        else:
+            raise FileNotFoundError(f"No input files match {pattern!r}")
+    return input_files
+
+
+def read_ahead(filename: str) -> None:
+    """Ask the OS to start reading a file into the page cache, without waiting"""
+
+    if filename == STDIN or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(filename, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+
+def solve_sequentially(
+    run: Callable[[str], object], input_files: list[str]
+) -> Iterator[object]:
+    """Solve each file in turn, yielding answers, or what solving one raised"""
+
+    for index, input_file in enumerate(input_files):
+        # The next file is read in the background while this one is solved
+        if index + 1 < len(input_files):
+            read_ahead(input_files[index + 1])
+        try:
+            yield run(input_file)
+        except Exception as e:
+            yield e
+
+
+def solve_in_parallel(
+    solve_file: Callable[[str], object], input_files: list[str], jobs: int
+) -> Iterator[object]:
+    """Solve each file in a worker process, yielding answers in input order
+
+    A file whose solver raises yields the exception instead, and the rest are
+    still solved. solve_file must be picklable, e.g. a partial of a
+    module-level function.
+    """
+
+    # Pulls in multiprocessing, which most runs, of a single input, don't need
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(solve_file, f) for f in input_files]
+        for future in futures:
+            try:
+                yield future.result()
+            except Exception as e:
+                yield e
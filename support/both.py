@@ -0,0 +1,41 @@
+"""Solving both parts of a day from a single parse of the input
+
+Parts that share a parser declare it as `parse`, along with `solve_parsed`,
+which solves from whatever `parse` returns. Both parts must declare the same
+`parse`, and `solve_parsed` must not change what it's given.
+"""
+
+from __future__ import annotations
+
+import os.path
+from types import ModuleType
+
+from support import phase, slurp, solvers
+
+PARTS = ("part1", "part2")
+
+
+def part_filenames(module_filename: str) -> list[str]:
+    directory = os.path.dirname(os.path.abspath(module_filename))
+    return [os.path.join(directory, f"{part}.py") for part in PARTS]
+
+
+def load_parts(module_filename: str) -> list[ModuleType]:
+    day = os.path.basename(os.path.dirname(os.path.abspath(module_filename)))
+    parts = [solvers.load_module(f"{day}.{part}") for part in PARTS]
+    if not all(hasattr(part, "solve_parsed") for part in parts):
+        raise ValueError(f"Not every part of {day} defines solve_parsed")
+    if len({part.parse for part in parts}) != 1:
+        raise ValueError(f"The parts of {day} don't share a parse")
+    return parts
+
+
+def solve_both(module_filename: str, input_file: str) -> tuple[object, ...]:
+    """Every part's answer for an input, which is read and parsed just once"""
+
+    parts = load_parts(module_filename)
+    with phase("read"):
+        input_data = slurp(input_file)
+    with phase("parse"):
+        parsed = parts[0].parse(input_data)
+    return tuple(part.solve_parsed(parsed) for part in parts)
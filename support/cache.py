@@ -0,0 +1,138 @@
+"""Content-addressed, size-bounded caches on local disk"""
+
+from __future__ import annotations
+
+import functools
+import glob
+import hashlib
+import os
+import os.path
+import pickle
+import sys
+import tempfile
+from typing import Callable, TypeVar
+
+from support import solvers
+
+Parsed = TypeVar("Parsed")
+
+CACHE_DIR = os.environ.get("AOC_CACHE_DIR") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "aoc2023"
+)
+SUPPORT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class DiskCache:
+    """A directory of files named by key, evicting least recently used
+
+    Entries are touched when read, so mtime order is recency order.
+    """
+
+    def __init__(self, namespace: str, max_bytes: int) -> None:
+        self.directory = os.path.join(CACHE_DIR, namespace)
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> bytes | None:
+        path = os.path.join(self.directory, key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        # Write then rename, so concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(value)
+        os.replace(tmp_path, os.path.join(self.directory, key))
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        total_bytes = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.startswith(".tmp-"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_bytes += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+
+
+def hash_file(filename: str) -> str:
+    with open(filename, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+@functools.cache
+def hash_source(module_filename: str) -> str:
+    """Hash every module in a solver's package and in support
+
+    Answers depend on more than the solver module: on its package's common.py,
+    and on the support code that reads, splits and parses inputs for it.
+    """
+
+    digest = hashlib.sha256()
+    package_dir = os.path.dirname(os.path.abspath(module_filename))
+    for directory in (package_dir, SUPPORT_DIR):
+        for path in sorted(glob.glob(os.path.join(directory, "*.py"))):
+            relative_path = os.path.join(
+                os.path.basename(directory), os.path.basename(path)
+            )
+            digest.update(relative_path.encode())
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+results = DiskCache("results", max_bytes=16 * 1024 * 1024)
+
+
+def result_keys(module_filenames: list[str], input_file: str) -> list[str]:
+    """The key of each solver's answer for an input, which is hashed just once"""
+
+    input_hash = hash_file(input_file)
+    keys = []
+    for module_filename in module_filenames:
+        day, part = solvers.day_and_part(module_filename)
+        source_hash = hash_source(os.path.abspath(module_filename))[:16]
+        keys.append(f"{day}-{part}-{source_hash}-{input_hash}")
+    return keys
+
+
+parsed = DiskCache("parsed", max_bytes=64 * 1024 * 1024)
+memos = DiskCache("memos", max_bytes=16 * 1024 * 1024)
+
+
+def parse(parser: Callable[[str], Parsed], input_data: str) -> Parsed:
+    """Load what parser returned for input_data before, or parse and store it"""
+
+    module_filename = sys.modules[parser.__module__].__file__ or ""
+    key = (
+        f"{parser.__module__}.{parser.__qualname__}-"
+        f"{hash_source(module_filename)[:16]}-"
+        f"{hashlib.sha256(input_data.encode()).hexdigest()}"
+    )
+    if (value := parsed.get(key)) is not None:
+        return pickle.loads(value)
+
+    result = parser(input_data)
+    parsed.put(key, pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+    return result
@@ -0,0 +1,44 @@
+"""Reading gzip, bzip2 and xz compressed inputs as if they weren't
+
+Compression is detected from the first bytes of a file, not its name, and
+inputs are decompressed as a stream, so the whole compressed input is never
+held in memory alongside the decompressed one.
+"""
+
+from __future__ import annotations
+
+import importlib
+import io
+from typing import BinaryIO
+
+# Magic bytes, and the module whose open() decompresses that format
+MAGIC = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bz2",
+    b"\xfd7zXZ\x00": "lzma",
+}
+MAGIC_SIZE = max(len(magic) for magic in MAGIC)
+
+
+def detect(header: bytes) -> str | None:
+    for magic, module_name in MAGIC.items():
+        if header.startswith(magic):
+            return module_name
+    return None
+
+
+def is_compressed(filename: str) -> bool:
+    with open(filename, "rb") as f:
+        return detect(f.read(MAGIC_SIZE)) is not None
+
+
+def decompressing(stream: io.BufferedReader) -> BinaryIO:
+    """stream itself, or a decompressing reader over it if it's compressed
+
+    Only peeks at stream, so nothing is consumed if it isn't compressed.
+    """
+
+    module_name = detect(stream.peek(MAGIC_SIZE)[:MAGIC_SIZE])
+    if module_name is None:
+        return stream
+    return importlib.import_module(module_name).open(stream)
@@ -0,0 +1,84 @@
+"""Keeping an answer up to date while records are appended to its input
+
+Works for solver modules that define `solve_lines` and `combine`: only the
+newly appended records are solved, and that answer is combined with the
+running total, so the file is never re-read.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import os.path
+import tempfile
+import time
+from typing import Any, Callable, Generator, Iterable
+
+from support import READ_SIZE, LineSolver, iter_records
+
+POLL_INTERVAL = 0.5
+
+
+def follow(
+    filename: str,
+    line_solver: LineSolver,
+    combine: Callable[[Iterable[Any]], Any],
+    separator: str = "\n",
+    poll_interval: float = POLL_INTERVAL,
+) -> Generator[Any, None, None]:
+    """Yield the answer for the whole file, then again after every append
+
+    A trailing record without a separator may still be being written, so it
+    isn't added to the running total until its separator arrives. Until then
+    each answer yielded includes it as it stands, as the last record of a file
+    that doesn't end in a separator (e.g. a day 15 file ending in "\n"). If
+    the file is truncated it is solved from the start again.
+    """
+
+    sep = separator.encode()
+    with open(filename, "rb") as f:
+        total = line_solver(())
+        pending = b""
+        first = True
+        while True:
+            if os.fstat(f.fileno()).st_size < f.tell():
+                f.seek(0)
+                total = line_solver(())
+                pending = b""
+
+            appended = False
+            while block := f.read(READ_SIZE):
+                data = pending + block
+                end = data.rfind(sep)
+                end = 0 if end < 0 else end + len(sep)
+                pending = data[end:]
+                appended = True
+                if end:
+                    answer = line_solver(iter_records(data, separator, 0, end))
+                    total = combine((total, answer))
+
+            if appended or first:
+                if pending.strip():
+                    yield combine((total, line_solver([pending.decode()])))
+                else:
+                    yield total
+                first = False
+            time.sleep(poll_interval)
+
+
+def first_total(
+    input_data: str,
+    line_solver: LineSolver,
+    combine: Callable[[Iterable[Any]], Any],
+    separator: str = "\n",
+) -> Any:
+    """What follow first yields for a file holding input_data, for tests"""
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "input.txt")
+        with open(filename, "wb") as f:
+            f.write(input_data.encode())
+        with contextlib.closing(
+            follow(filename, line_solver, combine, separator)
+        ) as totals:
+            return next(totals)
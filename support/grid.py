@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import Generator
+
+NEWLINE = ord("\n")
+
+
+class Grid:
+    """A rectangular grid of characters, stored as one flat bytearray
+
+    Cells are addressed by flat index `y * stride + x`. Each row keeps its
+    trailing newline, so `stride == width + 1` and building a grid from text
+    doesn't copy it row by row. The newline column also means stepping east
+    or west off the edge lands on a newline rather than wrapping to another
+    row's cell.
+
+    `offsets` are what to add to an index to step north, south, west and
+    east, worked out once per grid. Hot loops visit neighbours with them
+    directly, checking `in_bounds`, rather than through a generator:
+
+        for offset in grid.offsets:
+            if grid.in_bounds(neighbour := index + offset):
+                ...
+    """
+
+    __slots__ = ("data", "width", "height", "stride", "offsets")
+
+    def __init__(self, data: bytearray, width: int, height: int) -> None:
+        self.data = data
+        self.width = width
+        self.height = height
+        self.stride = width + 1
+        self.offsets = (-self.stride, self.stride, -1, 1)
+
+    @classmethod
+    def from_str(cls, s: str) -> Grid:
+        # Rows ending in \r\n would otherwise gain a column of \r cells
+        if "\r" in s:
+            s = s.replace("\r\n", "\n")
+        data = bytearray(s.encode())
+        if data and not data.endswith(b"\n"):
+            data.append(NEWLINE)
+        width = data.find(b"\n")
+        if width < 0:
+            return cls(data, 0, 0)
+        height = len(data) // (width + 1)
+        if len(data) != height * (width + 1):
+            raise ValueError("Grid rows must all be the same width")
+        return cls(data, width, height)
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.stride + x
+
+    def xy(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.stride)
+        return x, y
+
+    def __getitem__(self, index: int) -> int:
+        return self.data[index]
+
+    def at(self, index: int) -> str:
+        # Single character strings are cached by CPython, so this doesn't allocate
+        return chr(self.data[index])
+
+    def get(self, index: int, default: str = "") -> str:
+        """Like `at`, but default rather than wrapping or raising off the grid"""
+
+        if 0 <= index < len(self.data):
+            return chr(self.data[index])
+        return default
+
+    def in_bounds(self, index: int) -> bool:
+        return 0 <= index < len(self.data) and self.data[index] != NEWLINE
+
+    def row(self, y: int) -> memoryview:
+        start = y * self.stride
+        return memoryview(self.data)[start : start + self.width]
+
+    def col(self, x: int) -> memoryview:
+        return memoryview(self.data)[x :: self.stride]
+
+    def find(self, char: str, start: int = 0) -> int:
+        """Flat index of the first cell holding char, or -1"""
+
+        return self.data.find(ord(char), start)
+
+    def find_all(self, char: str) -> Generator[int, None, None]:
+        value = ord(char)
+        index = self.data.find(value)
+        while index >= 0:
+            yield index
+            index = self.data.find(value, index + 1)
@@ -0,0 +1,100 @@
+"""Named counters, timers and histograms for solver hot paths
+
+Everything is a no-op until `stats.enabled` is set (support.cli does this for
+--stats). Hot loops should tally locally and report once, or check
+`stats.enabled` before doing any extra work, so disabled runs pay nothing.
+
+`phase` marks the coarse phases of a run (e.g. `with phase("parse"):`) for
+--timings, and is likewise a no-op until enabled.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from collections import Counter, defaultdict
+from typing import ContextManager, Generator
+
+NULL_CONTEXT = contextlib.nullcontext()
+
+
+class Stats:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.reset()
+
+    def reset(self) -> None:
+        self.counters = Counter[str]()
+        self.timers = defaultdict[str, list[float]](list)
+        self.histograms = defaultdict[str, Counter[int]](Counter)
+
+    def incr(self, name: str, n: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] += n
+
+    def observe(self, name: str, value: int) -> None:
+        if self.enabled:
+            self.histograms[name][value] += 1
+
+    def timer(self, name: str) -> ContextManager[None]:
+        if not self.enabled:
+            return NULL_CONTEXT
+        return self._timer(name)
+
+    @contextlib.contextmanager
+    def _timer(self, name: str) -> Generator[None, None, None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timers[name].append(time.perf_counter() - start)
+
+    def report(self) -> str:
+        lines = []
+        for name, count in sorted(self.counters.items()):
+            lines.append(f"counter    {name:<40} {count}")
+        for name, timings in sorted(self.timers.items()):
+            total = sum(timings)
+            lines.append(
+                f"timer      {name:<40} n={len(timings)} "
+                f"total={total * 1000:.2f}ms mean={total / len(timings) * 1000:.3f}ms"
+            )
+        for name, histogram in sorted(self.histograms.items()):
+            n = histogram.total()
+            mean = sum(value * count for value, count in histogram.items()) / n
+            lines.append(
+                f"histogram  {name:<40} n={n} min={min(histogram)} "
+                f"max={max(histogram)} mean={mean:.2f}"
+            )
+            for value, count in sorted(histogram.items()):
+                lines.append(f"             {value:>10}: {count}")
+        return "\n".join(lines)
+
+
+class Phases:
+    """Total wall time spent in each named phase of a run"""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.reset()
+
+    def reset(self) -> None:
+        self.durations: dict[str, float] = {}
+
+    def __call__(self, name: str) -> ContextManager[None]:
+        if not self.enabled:
+            return NULL_CONTEXT
+        return self._phase(name)
+
+    @contextlib.contextmanager
+    def _phase(self, name: str) -> Generator[None, None, None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.durations[name] = self.durations.get(name, 0.0) + elapsed
+
+
+stats = Stats()
+phase = Phases()
@@ -0,0 +1,68 @@
+"""Solving one big input across processes, a chunk of records per task
+
+Works for solver modules that define `solve_lines` and a `combine` function
+that merges the answers for disjoint sets of records into the answer for all
+of them (e.g. `combine = sum`).
+"""
+
+from __future__ import annotations
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable
+
+from support import Buffer, LineSolver, iter_records, map_file
+
+# More chunks than workers, so one slow chunk doesn't leave the rest idle
+CHUNKS_PER_WORKER = 4
+
+
+def split_records(buffer: Buffer, separator: str, chunks: int) -> list[tuple[int, int]]:
+    """Split a buffer into about `chunks` byte ranges of whole records"""
+
+    sep = separator.encode()
+    size = len(buffer)
+    boundaries = [0]
+    for chunk in range(1, chunks):
+        approximate_start = chunk * size // chunks
+        if approximate_start <= boundaries[-1]:
+            continue
+        record_end = buffer.find(sep, approximate_start)
+        if record_end < 0:
+            break
+        boundaries.append(record_end + len(sep))
+    boundaries.append(size)
+
+    return [
+        (start, end) for start, end in itertools.pairwise(boundaries) if start < end
+    ]
+
+
+def solve_range(
+    filename: str, start: int, end: int, line_solver: LineSolver, separator: str
+) -> Any:
+    # Every worker maps the file itself, so no input is copied between processes
+    with map_file(filename) as buffer:
+        return line_solver(iter_records(buffer, separator, start, end))
+
+
+def map_reduce(
+    filename: str,
+    line_solver: LineSolver,
+    combine: Callable[[Iterable[Any]], Any],
+    separator: str,
+    workers: int,
+) -> Any:
+    with map_file(filename) as buffer:
+        ranges = split_records(buffer, separator, workers * CHUNKS_PER_WORKER)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partials = executor.map(
+            solve_range,
+            itertools.repeat(filename),
+            [start for start, _ in ranges],
+            [end for _, end in ranges],
+            itertools.repeat(line_solver),
+            itertools.repeat(separator),
+        )
+        return combine(partials)
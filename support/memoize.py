@@ -0,0 +1,156 @@
+"""Memoizing pure functions, in a bounded LRU table that can outlive the run
+
+Unlike functools.lru_cache, a memo counts its evictions as well as its hits
+and misses (support.cli reports all three with --stats), and can persist its
+table in the on-disk cache so a later run starts warm.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import os.path
+import pickle
+import sys
+import weakref
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+R = TypeVar("R")
+
+DEFAULT_MAXSIZE = 4096
+
+# Every memo, for --stats. Weak, so memos made per solve don't pile up
+registry: weakref.WeakSet[Memo[Any]] = weakref.WeakSet()
+
+
+class Memo(Generic[R]):
+    def __init__(
+        self, func: Callable[..., R], maxsize: int, persist: bool = False
+    ) -> None:
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.maxsize = maxsize
+        self.persist = persist
+        # Dicts keep insertion order, so the least recently used key is first
+        self.table: dict[Hashable, R] = {}
+        self.hits = self.misses = self.evictions = 0
+        self.loaded = not persist
+        self.changed = False
+        registry.add(self)
+
+    def __call__(self, *args: Hashable) -> R:
+        table = self.table
+        try:
+            value = table.pop(args)
+        except KeyError:
+            pass
+        else:
+            table[args] = value
+            self.hits += 1
+            return value
+
+        if not self.loaded:
+            self.load()
+            if args in table:
+                return self(*args)
+
+        self.misses += 1
+        value = table[args] = self.func(*args)
+        self.changed = True
+        if len(table) > self.maxsize:
+            del table[next(iter(table))]
+            self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Forget every result, but keep counting (support.cli resets counts)"""
+
+        self.table.clear()
+
+    def reset_counters(self) -> None:
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def name(self) -> str:
+        return f"{self.func.__module__}.{self.func.__qualname__}"
+
+    def cache_key(self) -> str:
+        from support import cache, solvers
+
+        # The module may be __main__, so its file tells the parts of a day apart
+        module_path = os.path.abspath(sys.modules[self.func.__module__].__file__ or "")
+        day, part = solvers.day_and_part(module_path)
+        return f"{day}-{part}-{self.name}-{cache.hash_source(module_path)[:16]}"
+
+    def load(self) -> None:
+        """Start from the table a previous run saved, if disk caching is on"""
+
+        self.loaded = True
+        import support
+
+        if not support.disk_cache_enabled:
+            return
+
+        from support import cache
+
+        if (stored := cache.memos.get(self.cache_key())) is not None:
+            try:
+                self.table.update(pickle.loads(stored))
+            except Exception:
+                # e.g. a class it references has since been renamed
+                pass
+        atexit.register(self.save)
+
+    def save(self) -> None:
+        if not self.changed:
+            return
+
+        from support import cache
+
+        table = pickle.dumps(self.table, pickle.HIGHEST_PROTOCOL)
+        cache.memos.put(self.cache_key(), table)
+        self.changed = False
+
+
+def memo(
+    maxsize: int = DEFAULT_MAXSIZE, persist: bool = False
+) -> Callable[[Callable[..., R]], Memo[R]]:
+    """Memoize a pure function of hashable positional arguments
+
+    At most maxsize results are kept, evicting the least recently used. With
+    persist, the table is saved to the on-disk cache at exit and loaded by
+    the next run, whenever support.cli has disk caching on. Saved tables are
+    invalidated by any edit to the function's package or to support.
+    """
+
+    def decorator(func: Callable[..., R]) -> Memo[R]:
+        return Memo(func, maxsize, persist)
+
+    return decorator
+
+
+def reset_counters() -> None:
+    for memoized in registry:
+        memoized.reset_counters()
+
+
+def clear() -> None:
+    """Forget every memo's results, e.g. so each timed run of a solver is cold"""
+
+    for memoized in registry:
+        memoized.clear()
+
+
+def report() -> list[tuple[str, int]]:
+    """(name, count) for every memo's hits, misses and evictions"""
+
+    counts = []
+    for memoized in registry:
+        counts.extend(
+            [
+                (f"memo.{memoized.name}.hits", memoized.hits),
+                (f"memo.{memoized.name}.misses", memoized.misses),
+                (f"memo.{memoized.name}.evictions", memoized.evictions),
+            ]
+        )
+    return counts
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import resource
+import sys
+import threading
+import tracemalloc
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+TOP_SITES = 10
+POLL_INTERVAL = 0.01
+# Only re-snapshot once traced memory has grown this much past the last one
+SNAPSHOT_GROWTH = 1.1
+
+
+def measure(func: Callable[[], T]) -> T:
+    """Run func under tracemalloc, reporting peak memory to stderr
+
+    Objects are mostly freed by the time func returns, so the top allocation
+    sites come from a snapshot taken by a watcher thread close to the peak.
+    If func returns before the watcher's first poll, only what's still
+    allocated at the end can be reported.
+    """
+
+    tracemalloc.start()
+    peak_snapshot = PeakSnapshotter()
+    peak_snapshot.start()
+    try:
+        result = func()
+    finally:
+        peak_snapshot.stop()
+        _, peak_traced = tracemalloc.get_traced_memory()
+        near_peak = peak_snapshot.snapshot is not None
+        snapshot = peak_snapshot.snapshot or tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    print(f"peak traced memory: {format_bytes(peak_traced)}", file=sys.stderr)
+    print(f"peak RSS: {format_bytes(peak_rss())}", file=sys.stderr)
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+    stats = snapshot.statistics("lineno")[:TOP_SITES]
+    if near_peak:
+        print(f"top {TOP_SITES} allocation sites near peak:", file=sys.stderr)
+    elif stats:
+        print(
+            f"finished before a snapshot near peak, top {TOP_SITES} allocation "
+            "sites still allocated at the end:",
+            file=sys.stderr,
+        )
+    else:
+        print(
+            "no allocation sites captured: finished before a snapshot near peak",
+            file=sys.stderr,
+        )
+    for stat in stats:
+        frame = stat.traceback[0]
+        print(
+            f"  {format_bytes(stat.size):>10} in {stat.count:>8} blocks "
+            f"{frame.filename}:{frame.lineno}",
+            file=sys.stderr,
+        )
+
+    return result
+
+
+class PeakSnapshotter(threading.Thread):
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self._snapshot_size = 0
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(POLL_INTERVAL):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self._snapshot_size * SNAPSHOT_GROWTH:
+                self.snapshot = tracemalloc.take_snapshot()
+                self._snapshot_size = current
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+def reset_peak_rss() -> bool:
+    """Restart peak_rss from the current RSS, if the OS allows it (Linux)"""
+
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def format_bytes(n: float) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(n) < 1024:
+            break
+        n /= 1024
+    return f"{n:.1f} {unit}"
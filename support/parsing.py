@@ -0,0 +1,56 @@
+"""Integer and token extraction on bytes, without a str per token
+
+Both work by translating separators to spaces in one pass and then splitting,
+which CPython does in C. int() accepts bytes directly, so the tokens never
+need decoding.
+"""
+
+from __future__ import annotations
+
+import functools
+from array import array
+from typing import TypeAlias
+
+Text: TypeAlias = str | bytes | bytearray | memoryview
+
+SPACE = ord(" ")
+NUMBER_BYTES = frozenset(b"-0123456789")
+
+# Every byte that can't be part of an integer becomes a space
+INTS_TABLE = bytes(c if c in NUMBER_BYTES else SPACE for c in range(256))
+
+
+def ints(data: Text) -> array[int]:
+    """Every integer in data, in order, as a compact array of signed 64-bit ints
+
+    Anything other than a digit or "-" separates integers, so
+    `ints("Game 12: 3 blue")` is `array('q', [12, 3])`. A "-" that isn't
+    directly followed by digits (e.g. "seed-to-soil") can't be parsed, so
+    pass only the part of the line that holds the numbers.
+    """
+
+    if isinstance(data, str):
+        data = data.encode()
+    elif not isinstance(data, bytes):
+        data = bytes(data)
+    return array("q", map(int, data.translate(INTS_TABLE).split()))
+
+
+@functools.cache
+def delimiter_table(delimiters: bytes) -> bytes:
+    return bytes(SPACE if c in delimiters else c for c in range(256))
+
+
+def tokens(data: Text, delimiters: bytes = b"") -> list[bytes]:
+    """Split data on whitespace and any of the delimiter bytes, dropping empties
+
+    `tokens("3 blue, 4 red", b",")` is `[b"3", b"blue", b"4", b"red"]`.
+    """
+
+    if isinstance(data, str):
+        data = data.encode()
+    elif not isinstance(data, bytes):
+        data = bytes(data)
+    if delimiters:
+        data = data.translate(delimiter_table(delimiters))
+    return data.split()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import signal
+import sys
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Callable, TypeVar
+
+from support import STDIN, solvers
+
+T = TypeVar("T")
+
+REPORT_LINES = 30
+
+# Seconds of CPU time between stack samples
+SAMPLE_INTERVAL = 0.005
+
+
+def output_path(module_filename: str, input_file: str, suffix: str) -> str:
+    """Where to write a report about a run: next to its input file
+
+    e.g. day05/input.txt.day05-part1.prof
+    """
+
+    day, part = solvers.day_and_part(module_filename)
+    prefix = "stdin" if input_file == STDIN else input_file
+    return f"{prefix}.{day}-{part}{suffix}"
+
+
+def profile(func: Callable[[], T], module_filename: str, input_file: str) -> T:
+    """Run func under cProfile, writing a .prof file and a sorted report"""
+
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func)
+
+    prof_path = output_path(module_filename, input_file, ".prof")
+    profiler.dump_stats(prof_path)
+
+    report = io.StringIO()
+    stats = pstats.Stats(profiler, stream=report)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats()
+    report_path = output_path(module_filename, input_file, ".prof.txt")
+    with open(report_path, "w") as f:
+        f.write(report.getvalue())
+
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats(
+        pstats.SortKey.CUMULATIVE
+    ).print_stats(REPORT_LINES)
+    print(summary.getvalue(), file=sys.stderr)
+    print(f"wrote {prof_path} and {report_path}", file=sys.stderr)
+
+    return result
+
+
+def sample(func: Callable[[], T], module_filename: str, input_file: str) -> T:
+    """Run func while sampling its stack, writing collapsed stacks for flame graphs
+
+    A CPU time interval timer interrupts the solver every SAMPLE_INTERVAL, and
+    the handler only counts the stack it interrupted, so the solver runs at
+    close to full speed. The .folded output has one "caller;callee count" line
+    per distinct stack, as read by flamegraph.pl, speedscope and inferno.
+    """
+
+    stacks = Counter[tuple[CodeType, ...]]()
+
+    def on_sample(signum: int, frame: FrameType | None) -> None:
+        stack = []
+        while frame is not None and frame.f_code is not sample_root.__code__:
+            stack.append(frame.f_code)
+            frame = frame.f_back
+        stacks[tuple(reversed(stack))] += 1
+
+    def sample_root() -> T:
+        return func()
+
+    previous_handler = signal.signal(signal.SIGPROF, on_sample)
+    signal.setitimer(signal.ITIMER_PROF, SAMPLE_INTERVAL, SAMPLE_INTERVAL)
+    try:
+        result = sample_root()
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, previous_handler)
+
+    folded = Counter[str]()
+    leaves = Counter[str]()
+    for stack, count in stacks.items():
+        # A sample taken in sample_root itself has nothing above it, but
+        # flame graph tools reject a line with no frames
+        labels = [frame_label(code) for code in stack or (sample_root.__code__,)]
+        folded[";".join(labels)] += count
+        leaves[labels[-1]] += count
+
+    folded_path = output_path(module_filename, input_file, ".folded")
+    with open(folded_path, "w") as f:
+        for stack_labels, count in sorted(folded.items()):
+            f.write(f"{stack_labels} {count}\n")
+    total = stacks.total()
+    print(f"top functions by samples of {total}:", file=sys.stderr)
+    for label, count in leaves.most_common(REPORT_LINES):
+        print(f"  {count / total:6.1%} {label}", file=sys.stderr)
+    print(f"wrote {folded_path}", file=sys.stderr)
+
+    return result
+
+
+def frame_label(code: CodeType) -> str:
+    return f"{code.co_qualname} ({code.co_filename}:{code.co_firstlineno})"
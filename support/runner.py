@@ -0,0 +1,76 @@
+"""Run every solver against every input across a process pool
+
+    $ python -m support.runner
+    $ python -m support.runner --jobs 4 day05 day08
+"""
+
+from __future__ import annotations
+
+import argparse
+import os.path
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from support import slurp, solvers
+
+
+class RunResult(NamedTuple):
+    module_name: str
+    input_file: str
+    answer: str
+    wall_time: float
+    cpu_time: float
+
+
+def run_one(module_name: str, input_file: str) -> RunResult:
+    solver = solvers.load(module_name)
+    input_data = slurp(input_file)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        answer = str(solver(input_data))
+    except Exception as e:
+        answer = f"error: {e!r}"
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+
+    return RunResult(module_name, input_file, answer, wall_time, cpu_time)
+
+
+def _run_one(task: tuple[str, str]) -> RunResult:
+    return run_one(*task)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("days", nargs="*", help="e.g. day05 (default: all)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    tasks: list[tuple[str, str]] = []
+    for module_name in solvers.discover(args.days):
+        input_files = solvers.find_inputs(module_name)
+        if not input_files:
+            print(f"{module_name:<12} (no input)")
+        tasks.extend((module_name, input_file) for input_file in input_files)
+
+    sweep_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        # map preserves submission order, so the report is stable
+        for result in executor.map(_run_one, tasks):
+            print(
+                f"{result.module_name:<12} "
+                f"{os.path.relpath(result.input_file, solvers.ROOT_DIR):<24} "
+                f"{result.answer:<20} "
+                f"wall={result.wall_time * 1000:9.2f}ms "
+                f"cpu={result.cpu_time * 1000:9.2f}ms"
+            )
+    print(f"total wall={(time.perf_counter() - sweep_start) * 1000:.2f}ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,126 @@
+"""A long-running solver service, with every solver already imported
+
+    $ python -m support.server --unix /tmp/aoc.sock
+    $ python -m support.server --port 8023 --workers 4
+
+Requests and responses are one JSON object per line:
+
+    {"day": 5, "part": 1, "input": "seeds: 79 14 55 13\\n..."}
+    {"answer": "35"}
+
+Failures are reported as {"error": "..."} and leave the connection open.
+Solves run in a bounded pool of worker processes that import every solver up
+front, so a request costs only its solve.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from support import solvers
+
+# Inputs arrive on a single line, so lines have to be allowed to get long
+MAX_REQUEST_BYTES = 256 * 1024 * 1024
+
+
+def warm_up() -> None:
+    for module_name in solvers.discover():
+        solvers.load_module(module_name)
+
+
+def solve_request(module_name: str, input_data: str) -> str:
+    return str(solvers.load(module_name)(input_data))
+
+
+class SolverService:
+    def __init__(self, workers: int) -> None:
+        self.module_names = set(solvers.discover())
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=warm_up)
+        # Bound how many inputs are held in memory waiting for a worker
+        self.pending = asyncio.Semaphore(workers * 2)
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while line := await reader.readline():
+                response = await self.handle_request(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def handle_request(self, line: bytes) -> dict[str, Any]:
+        try:
+            request = json.loads(line)
+            module_name = f"day{int(request['day']):02}.part{int(request['part'])}"
+            input_data = request["input"]
+        except (ValueError, KeyError, TypeError) as e:
+            return {"error": f"Invalid request: {e!r}"}
+        if module_name not in self.module_names:
+            return {"error": f"No solver for {module_name}"}
+
+        async with self.pending:
+            loop = asyncio.get_running_loop()
+            try:
+                answer = await loop.run_in_executor(
+                    self.executor, solve_request, module_name, input_data
+                )
+            except Exception as e:
+                return {"error": repr(e)}
+        return {"answer": answer}
+
+
+async def serve(args: argparse.Namespace) -> None:
+    service = SolverService(args.workers)
+    # Start every worker now, rather than on the first requests
+    await asyncio.gather(
+        *(
+            asyncio.get_running_loop().run_in_executor(service.executor, warm_up)
+            for _ in range(args.workers)
+        )
+    )
+
+    if args.unix:
+        server = await asyncio.start_unix_server(
+            service.handle_connection, path=args.unix, limit=MAX_REQUEST_BYTES
+        )
+    else:
+        server = await asyncio.start_server(
+            service.handle_connection,
+            host=args.host,
+            port=args.port,
+            limit=MAX_REQUEST_BYTES,
+        )
+    print(f"serving {len(service.module_names)} solvers on {args.unix or args.port}")
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.executor.shutdown(cancel_futures=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    address = parser.add_mutually_exclusive_group()
+    address.add_argument("--unix", metavar="PATH", help="listen on a Unix socket")
+    address.add_argument("--port", type=int, default=8023)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
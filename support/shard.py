@@ -0,0 +1,128 @@
+"""Solving one input in shards, anywhere, and merging their partial aggregates
+
+    $ python -m day01.part1 huge.txt --shard 1/3   # and 2/3 and 3/3, anywhere
+    $ python -m day01.part1 --merge huge.txt.day01-part1.shard-*-of-3.partial.json
+
+Shard i of N solves only the records that start in the i-th N-th of the
+input's bytes, so shards need no coordination beyond a copy of the input.
+Each writes its partial aggregate as JSON next to the input.
+
+A solver is shardable if it defines `solve_partial`, the partial aggregate of
+some records, and `merge_partials`, the answer from every shard's partial (in
+shard order, and after a round trip through JSON). Solvers with `solve_lines`
+and `combine` need neither: their answers for chunks are the partials.
+"""
+
+from __future__ import annotations
+
+import json
+import os.path
+from types import ModuleType
+from typing import Any, Callable, Iterable
+
+from support import Buffer, LineSolver, iter_records, map_file, solvers
+
+SUFFIX = ".partial.json"
+
+
+def partial_solver(module: ModuleType) -> LineSolver:
+    return getattr(module, "solve_partial", None) or module.solve_lines
+
+
+def merger(module: ModuleType) -> Callable[[Iterable[Any]], Any]:
+    return getattr(module, "merge_partials", None) or module.combine
+
+
+def parse_spec(spec: str) -> tuple[int, int]:
+    """(i, N) from "i/N", counting shards from 1"""
+
+    index, _, shards = spec.partition("/")
+    try:
+        parsed = int(index), int(shards)
+    except ValueError:
+        raise ValueError(f"--shard takes i/N, e.g. 2/8, not {spec!r}") from None
+    if not 1 <= parsed[0] <= parsed[1]:
+        raise ValueError(f"--shard {spec}: i must be from 1 to N")
+    return parsed
+
+
+def boundary(buffer: Buffer, separator: str, shard: int, shards: int) -> int:
+    """Where shard `shard` (counting from 0) starts: just after a separator"""
+
+    if shard == 0:
+        return 0
+    if shard == shards:
+        return len(buffer)
+    sep = separator.encode()
+    record_end = buffer.find(sep, shard * len(buffer) // shards)
+    return len(buffer) if record_end < 0 else record_end + len(sep)
+
+
+def shard_range(
+    buffer: Buffer, separator: str, index: int, shards: int
+) -> tuple[int, int]:
+    """The byte range of the whole records in shard index/shards
+
+    Worked out from the buffer alone, so every shard agrees on the boundaries.
+    A shard of a small input may be empty.
+    """
+
+    return (
+        boundary(buffer, separator, index - 1, shards),
+        boundary(buffer, separator, index, shards),
+    )
+
+
+def partial_path(module_filename: str, input_file: str, index: int, shards: int) -> str:
+    """e.g. day01/input.txt.day01-part1.shard-2-of-3.partial.json"""
+
+    day, part = solvers.day_and_part(module_filename)
+    return f"{input_file}.{day}-{part}.shard-{index}-of-{shards}{SUFFIX}"
+
+
+def solve_shard(
+    module: ModuleType, module_filename: str, input_file: str, index: int, shards: int
+) -> str:
+    """Write the partial aggregate of one shard of an input, returning its path"""
+
+    separator = getattr(module, "RECORD_SEPARATOR", "\n")
+    with map_file(input_file) as buffer:
+        start, end = shard_range(buffer, separator, index, shards)
+        partial = partial_solver(module)(iter_records(buffer, separator, start, end))
+        input_bytes = len(buffer)
+
+    day, part = solvers.day_and_part(module_filename)
+    record = {
+        "day": day,
+        "part": part,
+        "input": os.path.basename(input_file),
+        "input_bytes": input_bytes,
+        "shard": index,
+        "shards": shards,
+        "partial": partial,
+    }
+    path = partial_path(module_filename, input_file, index, shards)
+    with open(path, "w") as f:
+        json.dump(record, f)
+    return path
+
+
+def merge(module: ModuleType, module_filename: str, partial_files: list[str]) -> Any:
+    """The answer from the partial aggregates of every shard of one input"""
+
+    records = []
+    for partial_file in partial_files:
+        with open(partial_file) as f:
+            records.append(json.load(f))
+
+    day, part = solvers.day_and_part(module_filename)
+    if any((r["day"], r["part"]) != (day, part) for r in records):
+        raise ValueError(f"Not every partial is from {day} {part}")
+    if len({(r["input"], r["input_bytes"], r["shards"]) for r in records}) != 1:
+        raise ValueError("The partials aren't all from shards of the same input")
+    shards = records[0]["shards"]
+    if sorted(r["shard"] for r in records) != list(range(1, shards + 1)):
+        raise ValueError(f"Need exactly one partial for each of {shards} shards")
+
+    records.sort(key=lambda r: r["shard"])
+    return merger(module)(r["partial"] for r in records)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import glob
+import importlib
+import os.path
+import re
+from types import ModuleType
+
+from support import Solver
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# day00 is the template every other day is copied from, not a real solver
+TEMPLATE_DAY = "day00"
+
+SOLVER_PATTERN = re.compile(r"^(day[0-9]{2})/(part[0-9])\.py$")
+
+
+def discover(days: list[str] | None = None) -> list[str]:
+    """Find the module names of every `dayNN/partN.py` solver, in order"""
+
+    module_names = []
+    for path in sorted(glob.glob(os.path.join(ROOT_DIR, "day*", "part*.py"))):
+        relative_path = os.path.relpath(path, ROOT_DIR).replace(os.sep, "/")
+        match = SOLVER_PATTERN.match(relative_path)
+        if not match:
+            continue
+        day, part = match.groups()
+        if day == TEMPLATE_DAY or (days and day not in days):
+            continue
+        module_names.append(f"{day}.{part}")
+    return module_names
+
+
+def find_inputs(module_name: str) -> list[str]:
+    """Every `input*.txt` alongside the given solver module"""
+
+    day, _, _ = module_name.partition(".")
+    return sorted(glob.glob(os.path.join(ROOT_DIR, day, "input*.txt")))
+
+
+def day_and_part(module_filename: str) -> tuple[str, str]:
+    """e.g. ("day05", "part1") for day05/part1.py, wherever it's run from"""
+
+    module_path = os.path.abspath(module_filename)
+    day = os.path.basename(os.path.dirname(module_path))
+    part = os.path.splitext(os.path.basename(module_path))[0]
+    return day, part
+
+
+def load_module(module_name: str) -> ModuleType:
+    """Import a solver module: only support and its own dependencies, no pytest"""
+
+    return importlib.import_module(module_name)
+
+
+def load(module_name: str) -> Solver:
+    return load_module(module_name).solve_for
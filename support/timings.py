@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+import os
+import os.path
+import sys
+import time
+from typing import Callable, TypeVar
+
+from support import STDIN, phase, solvers
+from support.memory import peak_rss, reset_peak_rss
+
+T = TypeVar("T")
+
+# Phases every record has, even if a run never entered them
+STANDARD_PHASES = ("read", "parse")
+
+# The peak RSS is reset before each run, so the process's own is kept here
+process_peak_rss = 0
+
+
+def measure(func: Callable[[], T], module_filename: str, input_file: str) -> T:
+    """Run func, writing a JSON record of where its time went to stderr
+
+    Reading the input and any phases the solver marks with `support.phase`
+    are timed separately; whatever is left is "solve". Streaming solvers read
+    as they go, so their reading counts as solving.
+
+    peak_rss_bytes is the peak during this run alone, or null where the OS
+    can't reset the peak. Memory an earlier input left resident still counts.
+    process_peak_rss_bytes is the peak since the process started.
+    """
+
+    global process_peak_rss
+    process_peak_rss = max(process_peak_rss, peak_rss())
+    per_run = reset_peak_rss()
+
+    phase.reset()
+    phase.enabled = True
+    start = time.perf_counter()
+    try:
+        result = func()
+    finally:
+        total = time.perf_counter() - start
+        phase.enabled = False
+
+    run_peak_rss = peak_rss()
+    process_peak_rss = max(process_peak_rss, run_peak_rss)
+
+    durations = dict.fromkeys(STANDARD_PHASES, 0.0) | phase.durations
+    day, part = solvers.day_and_part(module_filename)
+    record = {
+        "day": day,
+        "part": part,
+        "input": input_file,
+        "input_bytes": None if input_file == STDIN else os.path.getsize(input_file),
+        **durations,
+        "solve": total - sum(durations.values()),
+        "total": total,
+        "peak_rss_bytes": run_peak_rss if per_run else None,
+        "process_peak_rss_bytes": process_peak_rss,
+    }
+    print(json.dumps(record), file=sys.stderr)
+
+    return result